@@ -4,39 +4,34 @@ Simple Text OCR - API Ninjas Only
 Outputs only the extracted text from API Ninjas OCR
 """
 
-import requests
-from PIL import Image, ImageGrab
-import io
+import ocr_core
+import sys
 
 def capture_and_extract_text(x, y, width, height):
     """Capture screen area and extract text using API Ninjas"""
     try:
         # Capture screenshot
-        screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
+        screenshot = ocr_core.capture(x, y, width, height)
         
-        # Convert to bytes
-        buffered = io.BytesIO()
-        screenshot.save(buffered, format="PNG")
-        img_bytes = buffered.getvalue()
+        # Upload to API Ninjas (skipped for previously seen pixels)
+        text, status = ocr_core.ocr(screenshot)
         
-        # API Ninjas request
-        url = "https://api.api-ninjas.com/v1/imagetotext"
-        files = {'image': ('image.png', img_bytes, 'image/png')}
-        
-        response = requests.post(url, files=files, timeout=15)
-        
-        if response.status_code == 200:
-            result = response.json()
-            text = ' '.join([item.get('text', '') for item in result])
-            return text.strip()
+        if status == 200:
+            return text
         else:
-            return f"API error: {response.status_code}"
+            return f"API error: {status}"
             
     except Exception as e:
         return f"Error: {e}"
 
 def main():
     """Simple interactive text extraction"""
+    # Pass --verbose for per-call OCR diagnostics, --target-height N to
+    # change how far uploads are downscaled
+    ocr_core.configure_from_argv(sys.argv)
+    # General text output: keep the digit-only Tesseract backend out of the chain
+    ocr_core.set_backends([ocr_core.ApiNinjasBackend()])
+    
     print("Text OCR - API Ninjas Only")
     print("Enter coordinates to extract text:")
     
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Shared OCR pipeline for the API Ninjas tools
+
+Screen capture, OCR backends and roulette number parsing used by
+ninja_text_only.py, optimized_ocr.py and roulette_ninja_extractor.py.
+Recognition runs locally with Tesseract when it is installed and falls back
+to the API Ninjas image-to-text endpoint otherwise. PIL, mss and requests are
+imported on first use so the interactive menus start without paying for them.
+"""
+
+import logging
+import re
+import threading
+import time
+import io
+import os
+import hashlib
+from collections import OrderedDict
+
+# Optional faster JSON parsing for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional fast hashing for the OCR result cache
+try:
+    import xxhash
+    _pixel_hash = xxhash.xxh3_64_intdigest
+except ImportError:
+    def _pixel_hash(data):
+        return hashlib.blake2b(data, digest_size=8).digest()
+
+API_NINJAS_URL = "https://api.api-ninjas.com/v1/imagetotext"
+
+# Per-call diagnostics go through this logger; see configure_logging()
+log = logging.getLogger("ocr")
+
+# Whole-word numbers 0-36 (leading zeros allowed), so out-of-range values never match
+_ROULETTE_RE = re.compile(r'\b0*([0-9]|[12][0-9]|3[0-6])\b')
+# With require_digits, a backend read without a single digit is treated as a miss
+_DIGIT_RE = re.compile(r'\d')
+
+def configure_logging(verbose=False):
+    """Send OCR diagnostics to stderr; debug lines only appear when verbose"""
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+    log.setLevel(logging.DEBUG if verbose else logging.INFO)
+
+def configure_from_argv(argv):
+    """Apply the shared command-line flags: --verbose and --target-height N"""
+    global TARGET_HEIGHT
+    configure_logging("--verbose" in argv)
+    if "--target-height" in argv:
+        idx = argv.index("--target-height")
+        try:
+            TARGET_HEIGHT = int(argv[idx + 1])
+        except (IndexError, ValueError):
+            log.warning("--target-height needs an integer value")
+
+def _create_session():
+    """Create a keep-alive session with a pooled, retrying adapter for API calls"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    retries = Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504],
+                    allowed_methods=None, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+# Reused across calls so the TCP/TLS connection to API Ninjas stays open
+_session = None
+_session_lock = threading.Lock()
+
+def _get_session():
+    """Return the shared API session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _create_session()
+    return _session
+
+# Uploads taller than this are shrunk by an integer factor first; also undoes
+# the 2x backing-store scale of HiDPI captures. Set to 0 to upload full size.
+TARGET_HEIGHT = 80
+
+# Frames where the minority polarity (dark ink on a light background, or
+# light ink on a dark one) covers less than this share are treated as empty
+# UI and never sent to the API
+MIN_INK_FRACTION = 0.005
+
+# Recognized text keyed by a hash of the captured pixels (LRU)
+OCR_CACHE_SIZE = 1024
+_ocr_cache = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+# (size, pixels, text) of the last recognized frame, checked before hashing
+_last_ocr = None
+
+# mss instances are not thread-safe, so keep one per thread
+_mss_local = threading.local()
+# Per-thread encode buffer reused across uploads
+_upload_local = threading.local()
+
+def _get_sct():
+    """Return this thread's mss screen grabber, creating it on first use"""
+    sct = getattr(_mss_local, 'sct', None)
+    if sct is None:
+        import mss
+        sct = mss.mss()
+        _mss_local.sct = sct
+    return sct
+
+def _get_frame(size):
+    """Return this thread's reusable RGB frame, reallocating only when the size changes"""
+    frame = getattr(_mss_local, 'frame', None)
+    if frame is None or frame.size != size:
+        from PIL import Image
+        frame = Image.new("RGB", size)
+        _mss_local.frame = frame
+    return frame
+
+def _encode_image(image, fmt):
+    """Encode an image for upload (grayscale JPEG is far cheaper than PNG)
+    
+    Returns this thread's upload buffer, rewound so requests reads it
+    directly instead of going through a getvalue() copy. The buffer is
+    overwritten by the next encode on the same thread.
+    """
+    buffered = getattr(_upload_local, 'buffer', None)
+    if buffered is None:
+        buffered = io.BytesIO()
+        _upload_local.buffer = buffered
+    
+    # Overwrite in place and trim the tail afterwards, so a buffer that has
+    # already grown to frame size is not reallocated on every call
+    buffered.seek(0)
+    if fmt == "JPEG":
+        image.convert("L").save(buffered, format="JPEG", quality=85)
+    else:
+        image.save(buffered, format="PNG")
+    buffered.truncate()
+    buffered.seek(0)
+    return buffered
+
+def _downscale_for_upload(image):
+    """Shrink a tall capture towards TARGET_HEIGHT with a fast box reduce"""
+    if TARGET_HEIGHT <= 0:
+        return image
+    factor = image.height // TARGET_HEIGHT
+    if factor < 2:
+        return image
+    return image.reduce(factor)
+
+def _post_image(image, timeout=15):
+    """Upload an image to API Ninjas as JPEG, retrying as PNG if it is rejected"""
+    session = _get_session()
+    image = _downscale_for_upload(image)
+    files = {'image': ('image.jpg', _encode_image(image, "JPEG"), 'image/jpeg')}
+    response = session.post(API_NINJAS_URL, files=files, timeout=timeout)
+    
+    if response.status_code in (400, 415, 422):
+        files = {'image': ('image.png', _encode_image(image, "PNG"), 'image/png')}
+        response = session.post(API_NINJAS_URL, files=files, timeout=timeout)
+    
+    return response
+
+def _looks_blank(image):
+    """Return True if a frame is almost entirely dark or almost entirely light"""
+    histogram = image.convert("L").histogram()
+    total = image.width * image.height
+    dark = sum(histogram[:128])
+    return min(dark, total - dark) < MIN_INK_FRACTION * total
+
+class OCRError(Exception):
+    """Raised by an OCR backend when recognition fails"""
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+class OCRBackend:
+    """Interface for OCR engines: recognize(image) returns the text found"""
+    name = "base"
+    
+    def recognize(self, image):
+        raise NotImplementedError
+
+class TesseractBackend(OCRBackend):
+    """Local Tesseract OCR restricted to digits - no network round-trip"""
+    name = "tesseract"
+    
+    def __init__(self, config='--psm 7 -c tessedit_char_whitelist=0123456789 '):
+        self.config = config
+        self._pytesseract = None
+    
+    def _load(self):
+        """Import pytesseract and point it at a Homebrew tesseract if present"""
+        if self._pytesseract is None:
+            import pytesseract
+            for cmd in ('/opt/homebrew/bin/tesseract', '/usr/local/bin/tesseract'):
+                if os.path.exists(cmd):
+                    pytesseract.pytesseract.tesseract_cmd = cmd
+                    break
+            self._pytesseract = pytesseract
+        return self._pytesseract
+    
+    def recognize(self, image):
+        try:
+            pytesseract = self._load()
+        except ImportError as e:
+            raise OCRError(f"pytesseract not installed: {e}")
+        
+        try:
+            return pytesseract.image_to_string(image, config=self.config).strip()
+        except (pytesseract.TesseractNotFoundError, pytesseract.TesseractError) as e:
+            raise OCRError(f"tesseract failed: {e}")
+
+class AdaptivePoller:
+    """Spaces out API calls: backs off on HTTP 429, tightens again on success"""
+    def __init__(self, floor=0.1, ceiling=5.0):
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_interval = floor
+        self.last_call_ts = None
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Sleep until min_interval has passed since the previous call"""
+        with self._lock:
+            now = time.monotonic()
+            if self.last_call_ts is not None:
+                delay = self.last_call_ts + self.min_interval - now
+                if delay > 0:
+                    time.sleep(delay)
+                    now += delay
+            self.last_call_ts = now
+    
+    def record(self, status_code):
+        """Adjust the interval from the status of the call just made"""
+        with self._lock:
+            if status_code == 429:
+                self.min_interval = min(self.ceiling, self.min_interval * 2)
+                log.debug("Rate limited, polling every %.2fs", self.min_interval)
+            elif status_code == 200:
+                self.min_interval = max(self.floor, self.min_interval * 0.9)
+
+class ApiNinjasBackend(OCRBackend):
+    """Remote OCR through the API Ninjas image-to-text endpoint"""
+    name = "api_ninjas"
+    
+    def __init__(self, poller=None):
+        self.poller = poller or AdaptivePoller()
+    
+    def recognize(self, image):
+        self.poller.wait()
+        response = _post_image(image)
+        self.poller.record(response.status_code)
+        if response.status_code != 200:
+            raise OCRError(f"API error: HTTP {response.status_code}", response.status_code)
+        
+        result = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+        return ' '.join(item['text'] for item in result if 'text' in item).strip()
+
+# Tried in order; a backend that raises OCRError hands over to the next one
+_backends = [TesseractBackend(), ApiNinjasBackend()]
+
+def set_backends(backends):
+    """Replace the OCR backend chain and drop results cached from the old one"""
+    global _backends, _last_ocr
+    with _ocr_cache_lock:
+        _backends = list(backends)
+        _ocr_cache.clear()
+        _last_ocr = None
+
+def _recognize(image, require_digits=False):
+    """Run the backend chain; returns (text, status) like ocr()
+    
+    With require_digits, a read with no digits falls through to the next
+    backend, and ("", 200) is returned if every backend that answered came
+    back without digits.
+    """
+    status = None
+    answered = False
+    for backend in _backends:
+        try:
+            text = backend.recognize(image)
+        except OCRError as e:
+            log.debug("%s backend failed: %s", backend.name, e)
+            status = e.status
+            continue
+        if not require_digits or _DIGIT_RE.search(text):
+            log.debug("Recognized with %s", backend.name)
+            return text, 200
+        log.debug("%s backend found no digits", backend.name)
+        answered = True
+    if answered:
+        return "", 200
+    return None, status
+
+def capture(x, y, width, height):
+    """Capture a screen area as an RGB image
+    
+    The returned image is reused by the next capture on the same thread;
+    call .copy() on it to keep it around.
+    """
+    shot = _get_sct().grab({'left': x, 'top': y, 'width': width, 'height': height})
+    # Decode straight from mss' raw buffer into the reused frame
+    frame = _get_frame(shot.size)
+    frame.frombytes(memoryview(shot.raw), "raw", "BGRX")
+    return frame
+
+def ocr(image, require_digits=False):
+    """OCR an image with the backend chain, reusing cached text for pixels seen before
+    
+    Returns (text, status_code); text is None unless a backend succeeded, in
+    which case status_code is 200. On failure it is the last HTTP status
+    reported, or None. The roulette tools pass require_digits so a read
+    without digits moves on to the next backend instead of being returned.
+    """
+    global _last_ocr
+    pixels = image.tobytes()
+    # An unchanged frame is a plain memcmp against the previous one
+    last = _last_ocr
+    if last is not None and last[0] == image.size and last[1] == pixels:
+        log.debug("Frame unchanged, reusing last OCR result")
+        return last[2], 200
+    
+    key = (image.size, _pixel_hash(pixels))
+    with _ocr_cache_lock:
+        if key in _ocr_cache:
+            _ocr_cache.move_to_end(key)
+            log.debug("OCR cache hit")
+            _last_ocr = (image.size, pixels, _ocr_cache[key])
+            return _ocr_cache[key], 200
+    
+    if _looks_blank(image):
+        # Nothing worth recognizing; skip the round-trip entirely. The check
+        # is cheap to repeat, so the frame is left uncached
+        log.debug("Frame looks blank, skipping OCR request")
+        return "", 200
+    
+    text, status = _recognize(image, require_digits)
+    if text is None:
+        return None, status
+    if not text:
+        # Nothing usable came back; leave the frame uncached so the
+        # next capture of it gets another attempt
+        return text, 200
+    
+    with _ocr_cache_lock:
+        _ocr_cache[key] = text
+        _last_ocr = (image.size, pixels, text)
+        if len(_ocr_cache) > OCR_CACHE_SIZE:
+            _ocr_cache.popitem(last=False)
+    
+    return text, 200
+
+def parse_roulette(text):
+    """Return the unique roulette numbers (0-36) in text, in order of appearance"""
+    # The pattern only matches 0-36, so no range check is needed and the
+    # conversion runs as a single C-level map
+    valid_numbers = list(map(int, _ROULETTE_RE.findall(text)))
+    
+    log.debug("Found roulette numbers: %s", valid_numbers)
+    
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(valid_numbers))
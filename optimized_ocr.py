@@ -1,20 +1,25 @@
 #!/usr/bin/env python3
 """
 Optimized Roulette OCR Tool
-Uses API Ninjas OCR for reliable number recognition
+Reads digits with local Tesseract, falling back to API Ninjas OCR
 """
 
-import requests
-from PIL import Image, ImageGrab
-import io
-import re
+import ocr_core
 import os
+import sys
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+# Pass --no-debug to skip writing captured images to disk
+SAVE_DEBUG_IMAGES = "--no-debug" not in sys.argv
+
+# Debug images are written on a background thread so OCR starts immediately
+_debug_pool = ThreadPoolExecutor(max_workers=1)
 
 def capture_screen_area(x, y, width, height):
     """Capture screen area"""
     try:
-        screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
+        screenshot = ocr_core.capture(x, y, width, height)
         return screenshot
     except Exception as e:
         print(f"❌ Error capturing screen: {e}")
@@ -23,32 +28,39 @@ def capture_screen_area(x, y, width, height):
 def recognize_text_api_ninjas(image):
     """Extract text using API Ninjas OCR"""
     try:
-        # Convert to bytes
-        buffered = io.BytesIO()
-        image.save(buffered, format="PNG")
-        img_bytes = buffered.getvalue()
-        
-        # API Ninjas request
-        url = "https://api.api-ninjas.com/v1/imagetotext"
-        files = {'image': ('image.png', img_bytes, 'image/png')}
-        
-        response = requests.post(url, files=files, timeout=15)
+        # Upload to API Ninjas (skipped for previously seen pixels)
+        text, status = ocr_core.ocr(image, require_digits=True)
         
-        if response.status_code == 200:
-            result = response.json()
-            text = ' '.join([item.get('text', '') for item in result])
-            
-            # Output only the extracted text
-            print(text.strip())
-            return text.strip()
+        if status == 200:
+            ocr_core.log.debug(text)
+            return text
         else:
-            print(f"API error: {response.status_code}")
+            print(f"API error: {status}")
             return ""
             
     except Exception as e:
         print(f"OCR error: {e}")
         return ""
 
+def _write_debug_image(image, debug_dir):
+    """Write a debug image atomically (runs on the debug thread)"""
+    os.makedirs(debug_dir, exist_ok=True)
+    final_path = f"{debug_dir}/captured_image.png"
+    tmp_path = f"{final_path}.tmp"
+    image.save(tmp_path, format="PNG")
+    os.replace(tmp_path, final_path)
+
+def save_debug_image(image):
+    """Queue a copy of the capture for saving and return its path, or None if disabled"""
+    if not SAVE_DEBUG_IMAGES:
+        return None
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    debug_dir = f"debug_{timestamp}"
+    # Copy now: the capture frame is reused by the next screen grab
+    _debug_pool.submit(_write_debug_image, image.copy(), debug_dir)
+    return f"{debug_dir}/captured_image.png"
+
 def quick_test():
     """Quick test with example coordinates"""
     print("🎰 Quick Roulette Number Recognition Test")
@@ -67,10 +79,7 @@ def quick_test():
     print(f"✅ Captured area: ({x},{y}) size {width}x{height}")
     
     # Save for debugging
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    debug_dir = f"debug_{timestamp}"
-    os.makedirs(debug_dir, exist_ok=True)
-    image.save(f"{debug_dir}/captured_image.png")
+    save_debug_image(image)
     
     # Recognize text
     text = recognize_text_api_ninjas(image)
@@ -101,11 +110,9 @@ def interactive_mode():
             return []
         
         # Save for debugging
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        debug_dir = f"debug_{timestamp}"
-        os.makedirs(debug_dir, exist_ok=True)
-        image.save(f"{debug_dir}/captured_image.png")
-        print(f"💾 Image saved: {debug_dir}/captured_image.png")
+        debug_path = save_debug_image(image)
+        if debug_path:
+            print(f"💾 Saving image: {debug_path}")
         
         # Recognize text
         text = recognize_text_api_ninjas(image)
@@ -123,8 +130,12 @@ def interactive_mode():
 
 def main():
     """Main function"""
+    # Pass --verbose for per-call OCR diagnostics, --target-height N to
+    # change how far uploads are downscaled
+    ocr_core.configure_from_argv(sys.argv)
+    
     print("🎰 Optimized Roulette OCR Tool")
-    print("Using API Ninjas for reliable recognition")
+    print("Using local Tesseract (digits only), falling back to API Ninjas")
     print("=" * 50)
     
     while True:
@@ -1,46 +1,36 @@
 #!/usr/bin/env python3
 """
-Roulette Number Extractor - API Ninjas Only
-Simple tool to extract roulette numbers (0-36) from screen areas using API Ninjas OCR
+Roulette Number Extractor - Tesseract / API Ninjas
+Simple tool to extract roulette numbers (0-36) from screen areas using local
+Tesseract, falling back to API Ninjas OCR
 """
 
-import requests
-import re
-from PIL import Image, ImageGrab
-import io
+import ocr_core
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 def capture_screen_area(x, y, width, height):
     """Capture a specific area of the screen"""
     try:
-        screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
+        screenshot = ocr_core.capture(x, y, width, height)
         return screenshot
     except Exception as e:
         print(f"❌ Error capturing screen: {e}")
         return None
 
 def extract_text_with_ninja_api(image):
-    """Extract text from image using API Ninjas OCR"""
+    """Extract text from image with Tesseract, falling back to API Ninjas OCR"""
     try:
-        print("🔍 Using API Ninjas OCR to extract text...")
+        ocr_core.log.debug("🔍 Using Tesseract / API Ninjas OCR to extract text...")
         
-        # Convert image to bytes
-        buffered = io.BytesIO()
-        image.save(buffered, format="PNG")
-        img_bytes = buffered.getvalue()
+        # OCR locally or upload to API Ninjas (skipped for previously seen pixels)
+        text, status = ocr_core.ocr(image, require_digits=True)
         
-        # API Ninjas OCR request
-        url = "https://api.api-ninjas.com/v1/imagetotext"
-        files = {'image': ('image.png', img_bytes, 'image/png')}
-        
-        response = requests.post(url, files=files, timeout=15)
-        
-        if response.status_code == 200:
-            result = response.json()
-            text = ' '.join([item.get('text', '') for item in result])
-            return text.strip()
+        if status == 200:
+            return text
         else:
-            print(f"❌ API error: HTTP {response.status_code}")
+            print(f"❌ API error: HTTP {status}")
             return ""
             
     except Exception as e:
@@ -50,29 +40,14 @@ def extract_text_with_ninja_api(image):
 def extract_roulette_numbers(text):
     """Extract roulette numbers (0-36) from text"""
     try:
-        print(f"📝 Extracted text: '{text}'")
+        ocr_core.log.debug("📝 Extracted text: '%s'", text)
         
         if not text:
             print("❌ No text to analyze")
             return []
         
-        # Find all numbers in the text
-        number_matches = re.findall(r'\b\d+\b', text)
-        
-        valid_numbers = []
-        for match in number_matches:
-            try:
-                num = int(match)
-                if 0 <= num <= 36:  # Valid roulette numbers
-                    valid_numbers.append(num)
-                    print(f"   ✅ Found roulette number: {num}")
-                else:
-                    print(f"   ❌ Number out of range (0-36): {num}")
-            except ValueError:
-                continue
-        
-        # Remove duplicates while preserving order
-        unique_numbers = list(dict.fromkeys(valid_numbers))
+        # Find unique roulette numbers (0-36) in the text
+        unique_numbers = ocr_core.parse_roulette(text)
         
         return unique_numbers
         
@@ -80,17 +55,40 @@ def extract_roulette_numbers(text):
         print(f"❌ Error extracting numbers: {e}")
         return []
 
+def sample_screen_area(x, y, width, height, samples, interval=0.5, max_workers=8):
+    """Capture an area several times and OCR the samples with overlapping uploads"""
+    def ocr_sample():
+        # Runs on a pool thread, which has its own mss grabber and frame
+        image = capture_screen_area(x, y, width, height)
+        if not image:
+            return ""
+        return extract_text_with_ninja_api(image)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for i in range(samples):
+            if i:
+                time.sleep(interval)
+            futures.append(executor.submit(ocr_sample))
+        
+        return [future.result() for future in futures]
+
 def main():
     """Main function for interactive roulette number extraction"""
-    print("🎰 Roulette Number Extractor - API Ninjas")
+    # Pass --verbose for per-call OCR diagnostics, --target-height N to
+    # change how far uploads are downscaled
+    ocr_core.configure_from_argv(sys.argv)
+    
+    print("🎰 Roulette Number Extractor - Tesseract / API Ninjas")
     print("=" * 45)
     
     while True:
         print("\nOptions:")
         print("1. Extract numbers from screen area")
-        print("2. Exit")
+        print("2. Monitor screen area (multiple samples)")
+        print("3. Exit")
         
-        choice = input("\nEnter choice (1-2): ").strip()
+        choice = input("\nEnter choice (1-3): ").strip()
         
         if choice == "1":
             try:
@@ -107,7 +105,7 @@ def main():
                 if not image:
                     continue
                 
-                # Extract text with API Ninjas
+                # Extract text with Tesseract or API Ninjas
                 text = extract_text_with_ninja_api(image)
                 
                 # Extract roulette numbers from text
@@ -131,10 +129,35 @@ def main():
                 print("\n👋 Cancelled")
                 
         elif choice == "2":
+            try:
+                print("\n📐 Enter screen coordinates:")
+                x = int(input("X position (left): "))
+                y = int(input("Y position (top): "))
+                width = int(input("Width: "))
+                height = int(input("Height: "))
+                samples = int(input("Number of samples: "))
+                
+                print(f"\n📸 Sampling area {samples}x: ({x},{y}) size {width}x{height}")
+                
+                texts = sample_screen_area(x, y, width, height, samples)
+                
+                for idx, text in enumerate(texts, 1):
+                    numbers = extract_roulette_numbers(text)
+                    if numbers:
+                        print(f"🎯 Sample {idx}: {numbers}")
+                    else:
+                        print(f"❌ Sample {idx}: no roulette numbers found")
+                
+            except ValueError:
+                print("❌ Invalid input. Please enter numbers only.")
+            except KeyboardInterrupt:
+                print("\n👋 Cancelled")
+                
+        elif choice == "3":
             print("👋 Goodbye!")
             break
         else:
-            print("❌ Invalid choice. Please enter 1 or 2.")
+            print("❌ Invalid choice. Please enter 1, 2, or 3.")
 
 if __name__ == "__main__":
     main()
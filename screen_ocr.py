@@ -9,7 +9,13 @@ This tool allows you to select an area of the screen and extract visible numbers
 import sys
 import time
 import re
-import random
+import os
+import queue
+import hashlib
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Screen capture and OCR imports
@@ -26,6 +32,75 @@ except ImportError as e:
     DEPENDENCIES_AVAILABLE = False
     missing_deps = str(e)
 
+# Optional in-process Tesseract bindings (no subprocess or model reload per call)
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Optional direct screen grabbing (pyautogui writes a PNG per screenshot on macOS)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Optional JIT for the per-ROI column scans in the digit splitter
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Optional fast hashing for detecting unchanged captures
+try:
+    import xxhash
+    _frame_hash = xxhash.xxh3_64_intdigest
+except ImportError:
+    def _frame_hash(data):
+        return hashlib.blake2b(data, digest_size=8).digest()
+
+# Runs of digits in OCR output (the whitelist leaves only digits and whitespace)
+_DIGITS_RE = re.compile(r'\d+')
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _column_ink(digit_img):
+        """Return per-column white-pixel counts of a binary ROI"""
+        height, width = digit_img.shape
+        counts = np.zeros(width, dtype=np.int64)
+        for y in range(height):
+            for x in range(width):
+                if digit_img[y, x]:
+                    counts[x] += 1
+        return counts
+    
+    @njit(cache=True)
+    def _column_runs(inked):
+        """Return (start, end) column ranges where inked is True"""
+        runs = []
+        start = -1
+        for i in range(inked.shape[0]):
+            if inked[i]:
+                if start < 0:
+                    start = i
+            elif start >= 0:
+                runs.append((start, i))
+                start = -1
+        if start >= 0:
+            runs.append((start, inked.shape[0]))
+        return runs
+else:
+    def _column_ink(digit_img):
+        """Return per-column white-pixel counts of a binary ROI"""
+        return np.count_nonzero(digit_img, axis=0)
+    
+    def _column_runs(inked):
+        """Return (start, end) column ranges where inked is True"""
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], inked.astype(np.int8), [0]))))
+        return list(zip(edges[::2].tolist(), edges[1::2].tolist()))
+
 # Configure pyautogui for macOS
 if DEPENDENCIES_AVAILABLE:
     pyautogui.FAILSAFE = True
@@ -38,10 +113,164 @@ if DEPENDENCIES_AVAILABLE:
         except:
             pass
 
+# Structuring elements shared by the detectors and feature extraction
+if DEPENDENCIES_AVAILABLE:
+    _K3 = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+    _KH5 = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 1))
+    _KV5 = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 5))
+
+def _build_feature_table():
+    """Tabulate classify_digit_by_features' rules over quantized features
+    
+    Every comparison the rules make becomes a bin edge, so a feature
+    vector's bin indices select exactly the digit the rules would return
+    (-1 where no rule fires). With np.digitize(right=True), index >= k
+    means x > edge k; a "x < t" test uses the float just below t as edge.
+    """
+    below = lambda t: np.nextafter(t, -np.inf)
+    edges = (
+        np.array([0.0]),                     # holes: >= 1
+        np.array([below(0.3), 0.4, 0.5]),    # horizontal lines: < 0.3, > 0.4, > 0.5
+        np.array([below(0.3), 0.7]),         # vertical lines: < 0.3, > 0.7
+        np.array([below(0.3), 0.5, 0.6]),    # curves: < 0.3, > 0.5, > 0.6
+        np.array([0.3]),                     # density: > 0.3
+    )
+    table = np.full([len(e) + 1 for e in edges], -1, dtype=np.int8)
+    for idx in np.ndindex(table.shape):
+        holes, h_bin, v_bin, c_bin, d_bin = idx
+        if holes >= 1 and d_bin >= 1:
+            if c_bin >= 3:
+                table[idx] = 0  # Circle-like with hole
+            elif h_bin >= 2:
+                table[idx] = 8  # Has hole and horizontal lines
+            else:
+                table[idx] = 6  # Has hole; 6 and 9 aren't told apart by these features
+        elif v_bin >= 2 and h_bin == 0:
+            table[idx] = 1  # Mostly vertical
+        elif h_bin >= 3 and c_bin == 0:
+            table[idx] = 7 if v_bin == 0 else 4  # Horizontal top, with or without vertical
+        elif c_bin >= 2:
+            table[idx] = 3 if h_bin >= 2 else 2  # Curved, with or without horizontals
+    return edges, table
+
+# Bin edges per feature and the digit for every bin combination
+if DEPENDENCIES_AVAILABLE:
+    _FEATURE_EDGES, _FEATURE_TABLE = _build_feature_table()
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _classify_feature_rows(features, edges, table, centroids):
+        """Digit per (N, 5) feature row: table lookup, nearest centroid where it has none"""
+        count = features.shape[0]
+        digits = np.empty(count, dtype=np.int64)
+        for i in prange(count):
+            # digitize(right=True) is searchsorted(side='left')
+            digit = table[np.searchsorted(edges[0], features[i, 0]),
+                          np.searchsorted(edges[1], features[i, 1]),
+                          np.searchsorted(edges[2], features[i, 2]),
+                          np.searchsorted(edges[3], features[i, 3]),
+                          np.searchsorted(edges[4], features[i, 4])]
+            if digit < 0:
+                best = np.inf
+                for d in range(centroids.shape[0]):
+                    distance = 0.0
+                    for k in range(features.shape[1]):
+                        diff = features[i, k] - centroids[d, k]
+                        distance += diff * diff
+                    if distance < best:
+                        best = distance
+                        digit = d
+            digits[i] = digit
+        return digits
+else:
+    def _classify_feature_rows(features, edges, table, centroids):
+        """Digit per (N, 5) feature row: table lookup, nearest centroid where it has none"""
+        idx = tuple(np.digitize(features[:, i], e, right=True) for i, e in enumerate(edges))
+        digits = table[idx]
+        distances = ((features[:, None, :] - centroids[None]) ** 2).sum(axis=2)
+        return np.where(digits >= 0, digits, distances.argmin(axis=1))
+
+# Captures with at least this many gray pixels are OCR'd in horizontal
+# bands by a process pool; each band is at least STRIP_MIN_HEIGHT rows tall
+PARALLEL_OCR_MIN_PIXELS = 1_000_000
+STRIP_MIN_HEIGHT = 120
+
+# Per-process tesserocr session for the strip workers
+_worker_tess = None
+
+def _init_strip_worker():
+    """Pool initializer: build this worker's tesserocr session once"""
+    global _worker_tess
+    if TESSEROCR_AVAILABLE:
+        _worker_tess = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+        _worker_tess.SetVariable('tessedit_char_whitelist', '0123456789')
+
+def _ocr_strip(args):
+    """Pool worker: OCR rows y0:y1 of the gray image in shared memory"""
+    shm_name, shape, y0, y1, scale, psm = args
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        gray = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+        strip = gray[y0:y1]
+        height, width = strip.shape
+        scaled = cv2.resize(strip, (int(width * scale), int(height * scale)),
+                            interpolation=cv2.INTER_LANCZOS4)
+        # Drop the array views before the buffer is closed
+        del gray, strip
+        pil_img = Image.fromarray(scaled)
+        
+        if _worker_tess is not None:
+            _worker_tess.SetPageSegMode(psm)
+            _worker_tess.SetImage(pil_img)
+            return _worker_tess.GetUTF8Text()
+        config = f'--psm {psm} -c tessedit_char_whitelist=0123456789'
+        return pytesseract.image_to_string(pil_img, config=config)
+    finally:
+        shm.close()
+
+# Screenshot PNGs are encoded and written off the interactive thread
+_save_pool = ThreadPoolExecutor(max_workers=2)
+
+def _write_screenshot(bgr, filename):
+    """Background job: write a BGR frame as PNG (zlib level 3, not PIL's 6)"""
+    try:
+        if not cv2.imwrite(filename, bgr, [cv2.IMWRITE_PNG_COMPRESSION, 3]):
+            print(f"\n❌ Error saving screenshot: could not write {filename}")
+    except Exception as e:
+        print(f"\n❌ Error saving screenshot: {e}")
+
 class ScreenOCRTool:
     def __init__(self):
         self.capture_area = None
         self.last_screenshot = None
+        self._tess = None
+        self._tess_pool = None
+        self._sct = None
+        self._pool = None
+        # Numbers found per grayscale capture: (shape, pixel hash) -> (phash, numbers), LRU
+        self._result_cache = OrderedDict()
+        # (image, gray) of the last image converted by _as_gray
+        self._gray_cache = None
+        # (gray, {scale: upscaled gray}) shared by the OCR fallbacks
+        self._pyramid_cache = None
+        # Rendered 0-9 glyphs for classify_simple_digit, built on first use
+        self._digit_templates = None
+        # Mean feature vector per digit 0-9 for classify_digit_by_features' fallback
+        self._feature_centroids = None
+        # How often each aggressive OCR strategy produced a confident read
+        self._strategy_hits = Counter()
+        
+        # Preprocessing objects reused by every capture
+        if DEPENDENCIES_AVAILABLE:
+            self._clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+            self._sharp_kernel = np.array([[-1,-1,-1],
+                                           [-1, 9,-1],
+                                           [-1,-1,-1]], dtype=np.float32)
+            self._morph_kernel = np.ones((2, 2), np.uint8)
+            # Point-op lookup tables for the aggressive OCR strategies
+            levels = np.arange(256)
+            self._lut_contrast3 = np.clip(levels * 3, 0, 255).astype(np.uint8)
+            self._lut_invert = (255 - levels).astype(np.uint8)
         
     def check_dependencies(self):
         """Check if all required dependencies are installed"""
@@ -50,12 +279,163 @@ class ScreenOCRTool:
             print(f"Error: {missing_deps}")
             print("\n📦 To install required packages, run:")
             print("pip install pyautogui pytesseract pillow opencv-python")
+            print("pip install tesserocr  # optional, faster in-process OCR")
             print("\n🔧 Also install tesseract OCR engine:")
             print("brew install tesseract  # macOS")
             print("sudo apt-get install tesseract-ocr  # Ubuntu/Debian")
             return False
         return True
     
+    def _get_tess(self):
+        """Return the long-lived tesserocr session, creating it on first use"""
+        if self._tess is None:
+            self._tess = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+            self._tess.SetVariable('tessedit_char_whitelist', '0123456789')
+        return self._tess
+    
+    def ocr_digits(self, pil_img, psm=6):
+        """Run digit-only OCR, in-process via tesserocr when it is installed"""
+        if TESSEROCR_AVAILABLE:
+            tess = self._get_tess()
+            tess.SetPageSegMode(psm)
+            tess.SetImage(pil_img)
+            return tess.GetUTF8Text()
+        
+        config = f'--psm {psm} -c tessedit_char_whitelist=0123456789'
+        return pytesseract.image_to_string(pil_img, config=config)
+    
+    def _get_tess_pool(self):
+        """Return a queue of tesserocr sessions, one per CPU, for parallel sweeps"""
+        if self._tess_pool is None:
+            self._tess_pool = queue.Queue()
+            for _ in range(os.cpu_count() or 1):
+                tess = PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+                tess.SetVariable('tessedit_char_whitelist', '0123456789')
+                self._tess_pool.put(tess)
+        return self._tess_pool
+    
+    def ocr_digits_parallel(self, tasks):
+        """OCR a list of (pil_img, psm) tasks concurrently
+        
+        Returns (text, mean confidence 0-100) per task, in order. Tesseract
+        releases the GIL while recognizing, so threads scale with cores.
+        Without tesserocr each task is a pytesseract subprocess, which
+        overlaps just as well.
+        """
+        if TESSEROCR_AVAILABLE:
+            pool = self._get_tess_pool()
+            workers = pool.qsize()
+        else:
+            pool = None
+            workers = os.cpu_count() or 1
+        
+        def run(task):
+            pil_img, psm = task
+            try:
+                if pool is None:
+                    config = f'--psm {psm} -c tessedit_char_whitelist=0123456789'
+                    data = pytesseract.image_to_data(pil_img, config=config,
+                                                     output_type=pytesseract.Output.DICT)
+                    words = [(word, float(conf)) for word, conf in zip(data['text'], data['conf'])
+                             if word.strip() and float(conf) >= 0]
+                    if not words:
+                        return "", 0.0
+                    return (' '.join(word for word, _ in words),
+                            sum(conf for _, conf in words) / len(words))
+                
+                tess = pool.get()
+                try:
+                    tess.SetPageSegMode(psm)
+                    tess.SetImage(pil_img)
+                    return tess.GetUTF8Text(), float(tess.MeanTextConf())
+                finally:
+                    pool.put(tess)
+            except Exception:
+                return "", 0.0
+        
+        with ThreadPoolExecutor(max_workers=min(workers, len(tasks)) or 1) as executor:
+            return list(executor.map(run, tasks))
+    
+    def _get_pool(self):
+        """Return the OCR process pool, starting it on first use"""
+        if self._pool is None:
+            self._pool = mp.Pool(processes=mp.cpu_count(), initializer=_init_strip_worker)
+        return self._pool
+    
+    def close(self):
+        """Shut down the OCR process pool, if one was started"""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+    
+    def _strip_bounds(self, gray):
+        """Split gray's rows into bands, cutting at the flattest row near each boundary"""
+        height = gray.shape[0]
+        count = max(1, min(mp.cpu_count(), height // STRIP_MIN_HEIGHT))
+        if count == 1:
+            return [(0, height)]
+        
+        # A row with no contrast is background, so cutting there splits no digit
+        row_spread = gray.max(axis=1).astype(np.int16) - gray.min(axis=1)
+        window = STRIP_MIN_HEIGHT // 4
+        cuts = [0]
+        for i in range(1, count):
+            nominal = i * height // count
+            lo, hi = max(cuts[-1] + 1, nominal - window), min(height - 1, nominal + window)
+            cuts.append(lo + int(np.argmin(row_spread[lo:hi])))
+        cuts.append(height)
+        return list(zip(cuts[:-1], cuts[1:]))
+    
+    def ocr_strips_parallel(self, gray, scale, psm):
+        """OCR a large gray image as horizontal bands in worker processes
+        
+        The pixels go to the workers through one shared-memory block rather
+        than being pickled per band. Returns the band texts joined top to bottom.
+        """
+        shm = shared_memory.SharedMemory(create=True, size=gray.nbytes)
+        try:
+            shared = np.ndarray(gray.shape, dtype=np.uint8, buffer=shm.buf)
+            shared[:] = gray
+            del shared
+            
+            jobs = [(shm.name, gray.shape, y0, y1, scale, psm)
+                    for y0, y1 in self._strip_bounds(gray)]
+            return '\n'.join(self._get_pool().map(_ocr_strip, jobs))
+        finally:
+            shm.close()
+            shm.unlink()
+    
+    def _as_gray(self, image):
+        """Return image as a grayscale array, converting each image only once"""
+        cached = self._gray_cache
+        if cached is not None and cached[0] is image:
+            return cached[1]
+        
+        img_array = np.asarray(image)
+        if img_array.ndim == 3:
+            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        else:
+            gray = img_array
+        # Holding the image keeps its id from being reused by a new capture
+        self._gray_cache = (image, gray)
+        return gray
+    
+    def _get_pyramid(self, gray, scales):
+        """Return {scale: Lanczos-upscaled gray}, resizing each scale once per capture"""
+        cached = self._pyramid_cache
+        if cached is None or cached[0] is not gray:
+            cached = (gray, {})
+            self._pyramid_cache = cached
+        
+        pyramid = cached[1]
+        height, width = gray.shape
+        for scale in scales:
+            if scale not in pyramid:
+                pyramid[scale] = cv2.resize(gray, (int(width * scale), int(height * scale)),
+                                            interpolation=cv2.INTER_LANCZOS4)
+        return {scale: pyramid[scale] for scale in scales}
+    
     def get_screen_info(self):
         """Get information about screen dimensions"""
         try:
@@ -194,8 +574,17 @@ class ScreenOCRTool:
             print(f"📸 Capturing area: {x}, {y}, {width}x{height}")
             
             # Take screenshot of the specific area
-            screenshot = pyautogui.screenshot(region=(x, y, width, height))
+            if MSS_AVAILABLE:
+                if self._sct is None:
+                    self._sct = mss.mss()
+                shot = self._sct.grab({'left': x, 'top': y, 'width': width, 'height': height})
+                # Decode mss' raw BGRA buffer directly, no PNG round-trip
+                screenshot = Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+            else:
+                screenshot = pyautogui.screenshot(region=(x, y, width, height))
             self.last_screenshot = screenshot
+            self._gray_cache = None
+            self._pyramid_cache = None
             
             print("✅ Screenshot captured successfully")
             return screenshot
@@ -204,75 +593,98 @@ class ScreenOCRTool:
             print(f"❌ Error capturing screenshot: {e}")
             return None
     
-    def preprocess_image_advanced(self, image):
-        """Advanced preprocessing with multiple strategies for harder images"""
+    # Every strategy preprocess_image_advanced knows; the debug dump asks for all of them
+    PREPROCESS_STRATEGIES = ('standard', 'adaptive', 'enhanced', 'edges')
+    
+    # Large captures run their neighbourhood filters in tiles of this size so
+    # the intermediates of a chain stay in L2 instead of streaming through DRAM
+    TILE_SIZE = 256
+    
+    def _apply_tiled(self, func, src, halo):
+        """Apply a neighbourhood-local filter chain tile by tile
+        
+        halo must cover the chain's combined kernel radius; tiles overlap by
+        that much and only their interiors are written back, so the result
+        matches a whole-image call.
+        """
+        tile = self.TILE_SIZE
+        if isinstance(src, cv2.UMat) or max(src.shape[:2]) <= 2 * tile:
+            return func(src)
+        
+        height, width = src.shape[:2]
+        out = np.empty_like(src)
+        for y0 in range(0, height, tile):
+            y1 = min(y0 + tile, height)
+            ya = max(y0 - halo, 0)
+            for x0 in range(0, width, tile):
+                x1 = min(x0 + tile, width)
+                xa = max(x0 - halo, 0)
+                result = func(src[ya:min(y1 + halo, height), xa:min(x1 + halo, width)])
+                out[y0:y1, x0:x1] = result[y0 - ya:y1 - ya, x0 - xa:x1 - xa]
+        return out
+    
+    def _clean_binary(self, thresh):
+        """Close then open with the 2x2 kernel to tidy a binary image"""
+        cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, self._morph_kernel)
+        return cv2.morphologyEx(cleaned, cv2.MORPH_OPEN, self._morph_kernel)
+    
+    def _preprocess_standard(self, gray):
+        """Gaussian blur + Otsu threshold, cleaned with a close/open pass"""
+        blurred = cv2.GaussianBlur(gray, (3, 3), 0)
+        _, thresh = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return self._apply_tiled(self._clean_binary, thresh, halo=4)
+    
+    def _preprocess_adaptive(self, gray):
+        """Adaptive threshold for varying lighting"""
+        return self._apply_tiled(lambda g: cv2.adaptiveThreshold(
+            g, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
+        ), gray, halo=5)
+    
+    def _preprocess_enhanced(self, gray):
+        """CLAHE contrast + sharpening + Otsu, cleaned with a close/open pass"""
+        enhanced = self._clahe.apply(gray)
+        sharpened = cv2.filter2D(enhanced, -1, self._sharp_kernel)
+        _, thresh = cv2.threshold(sharpened, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return self._apply_tiled(self._clean_binary, thresh, halo=4)
+    
+    def _preprocess_edges(self, gray):
+        """Canny edges, dilated"""
+        edges = cv2.Canny(gray, 50, 150)
+        return cv2.dilate(edges, self._morph_kernel, iterations=1)
+    
+    def preprocess_image_advanced(self, image, strategies=('standard',)):
+        """Advanced preprocessing with multiple strategies for harder images
+        
+        Only the requested strategies are computed; pass
+        PREPROCESS_STRATEGIES to get every version.
+        """
         try:
-            # Convert PIL image to numpy array
-            img_array = np.array(image)
-            
-            # Convert to grayscale if not already
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
-            
-            # Strategy 1: Standard preprocessing
-            # Apply Gaussian blur to reduce noise
-            blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-            
-            # Apply threshold to get binary image
-            _, thresh1 = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            # Strategy 2: Adaptive threshold for varying lighting
-            adaptive_thresh = cv2.adaptiveThreshold(
-                gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2
-            )
-            
-            # Strategy 3: Enhanced contrast and sharpening
-            # Enhance contrast
-            enhanced = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
-            
-            # Sharpen the image
-            kernel_sharpen = np.array([[-1,-1,-1],
-                                     [-1, 9,-1],
-                                     [-1,-1,-1]])
-            sharpened = cv2.filter2D(enhanced, -1, kernel_sharpen)
-            
-            # Apply threshold to sharpened image
-            _, thresh2 = cv2.threshold(sharpened, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            # Strategy 4: Morphological operations
-            kernel = np.ones((2, 2), np.uint8)
-            
-            # Clean up thresh1
-            cleaned1 = cv2.morphologyEx(thresh1, cv2.MORPH_CLOSE, kernel)
-            cleaned1 = cv2.morphologyEx(cleaned1, cv2.MORPH_OPEN, kernel)
-            
-            # Clean up thresh2
-            cleaned2 = cv2.morphologyEx(thresh2, cv2.MORPH_CLOSE, kernel)
-            cleaned2 = cv2.morphologyEx(cleaned2, cv2.MORPH_OPEN, kernel)
+            # Grayscale conversion is shared with the other extraction passes
+            gray = self._as_gray(image)
+            
+            dispatch = {
+                'standard': self._preprocess_standard,
+                'adaptive': self._preprocess_adaptive,
+                'enhanced': self._preprocess_enhanced,
+                'edges': self._preprocess_edges,
+            }
             
-            # Strategy 5: Edge enhancement
-            edges = cv2.Canny(gray, 50, 150)
-            dilated_edges = cv2.dilate(edges, kernel, iterations=1)
+            # Run the filters through OpenCL (T-API) when a device is available;
+            # only the finished outputs are copied back to numpy
+            use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+            source = cv2.UMat(gray) if use_opencl else gray
             
             # Return multiple processed versions
-            return {
-                'original_gray': gray,
-                'standard': cleaned1,
-                'adaptive': adaptive_thresh,
-                'enhanced': cleaned2,
-                'edges': dilated_edges
-            }
+            processed = {'original_gray': gray}
+            for name in strategies:
+                result = dispatch[name](source)
+                processed[name] = result.get() if use_opencl else result
+            return processed
             
         except Exception as e:
             print(f"⚠️ Error in advanced preprocessing: {e}")
             # Fallback to simple grayscale
-            img_array = np.array(image)
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
+            gray = self._as_gray(image)
             return {'original_gray': gray}
     
     def extract_numbers_advanced(self, image):
@@ -284,11 +696,7 @@ class ScreenOCRTool:
             print("🔍 Processing image with OpenCV computer vision for roulette numbers (0-36)...")
             
             # Convert to grayscale
-            img_array = np.array(image)
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
+            gray = self._as_gray(image)
             
             print("📝 Using OpenCV-based digit detection (fallback to tesseract)")
             
@@ -310,29 +718,26 @@ class ScreenOCRTool:
         try:
             all_numbers = []
             
-            # Simple threshold detection
-            for thresh_val in [127, 100, 150]:
-                _, thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY)
-                
-                # Find contours
-                contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                
-                for contour in contours:
-                    area = cv2.contourArea(contour)
-                    if 100 < area < 2000:  # Reasonable digit size
-                        x, y, w, h = cv2.boundingRect(contour)
-                        aspect_ratio = w / h
-                        
-                        if 0.3 <= aspect_ratio <= 1.2 and h > 15 and w > 8:
-                            # Extract digit region
-                            digit_roi = thresh[y:y+h, x:x+w]
-                            
-                            # Basic digit classification (placeholder)
-                            predicted_digit = self.classify_simple_digit(digit_roi)
-                            
-                            if predicted_digit is not None and 0 <= predicted_digit <= 36:
-                                all_numbers.append((x, predicted_digit))
-                                print(f"   🎯 OpenCV found: {predicted_digit} at x={x}")
+            # One Otsu pass picks the global threshold the fixed 127/100/150
+            # sweep was guessing at, so the image is binarized and walked once
+            _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            
+            # Find contours
+            contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            
+            # Reasonable digit size, 0.3 <= aspect ratio <= 1.2
+            boxes = self._digit_boxes(contours, 100, 2000, 0.3, 1.2, 15, 8)
+            
+            # Extract digit regions (views into thresh, no copies)
+            rois = [thresh[y:y+h, x:x+w] for x, y, w, h in boxes]
+            
+            # Template-matching digit classification, one batch for all ROIs
+            predictions = self.classify_digits_batch(rois)
+            
+            for (x, _, _, _), predicted_digit in zip(boxes, predictions):
+                if predicted_digit is not None and 0 <= predicted_digit <= 36:
+                    all_numbers.append((x, predicted_digit))
+                    print(f"   🎯 OpenCV found: {predicted_digit} at x={x}")
             
             # Sort by x position and extract numbers
             if all_numbers:
@@ -346,178 +751,112 @@ class ScreenOCRTool:
             print(f"OpenCV detection error: {e}")
             return []
     
-    def classify_simple_digit(self, digit_img):
-        """Simple digit classification using basic features"""
-        try:
-            if digit_img is None or digit_img.size == 0:
+    # Size every glyph is normalized to before template matching (width, height)
+    DIGIT_TEMPLATE_SIZE = (20, 28)
+    
+    def _normalize_glyphs(self, glyphs):
+        """Stack same-size glyphs as zero-mean, unit-norm rows (N, H*W)"""
+        flat = np.stack(glyphs).reshape(len(glyphs), -1).astype(np.float32)
+        flat -= flat.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(flat, axis=1, keepdims=True)
+        return flat / np.maximum(norms, 1e-6)
+    
+    def _get_digit_templates(self):
+        """Render digits 0-9 once as normalized white-on-black template rows (10, H*W)"""
+        if self._digit_templates is None:
+            glyphs = []
+            for digit in range(10):
+                canvas = np.zeros((40, 30), dtype=np.uint8)
+                cv2.putText(canvas, str(digit), (2, 34), cv2.FONT_HERSHEY_SIMPLEX,
+                            1.2, 255, 3, cv2.LINE_AA)
+                x, y, w, h = cv2.boundingRect(canvas)
+                glyphs.append(cv2.resize(canvas[y:y+h, x:x+w], self.DIGIT_TEMPLATE_SIZE,
+                                         interpolation=cv2.INTER_AREA))
+            self._digit_templates = self._normalize_glyphs(glyphs)
+        return self._digit_templates
+    
+    def _split_glyphs(self, digit_img):
+        """Cut a binary ROI into 1-2 template-sized glyphs, or None if it can't be a number"""
+        if digit_img is None or digit_img.size == 0:
+            return None
+        
+        # Calculate basic features (the ROI is binary, so non-zero == white);
+        # one column scan gives both the density and the projection
+        column_white = _column_ink(digit_img)
+        density = column_white.sum() / digit_img.size
+        
+        # Very basic classification (can be improved)
+        if density < 0.2:
+            return None  # Too sparse
+        elif density > 0.8:
+            return None  # Too dense
+        
+        # Digits are the minority of the ROI; make them white like the templates
+        if density > 0.5:
+            digit_img = cv2.bitwise_not(digit_img)
+            column_white = digit_img.shape[0] - column_white
+        
+        # Split side-by-side digits on empty columns (horizontal projection)
+        runs = _column_runs(column_white > 0)
+        if not 1 <= len(runs) <= 2:
+            return None
+        
+        glyphs = []
+        for start, end in runs:
+            column = digit_img[:, start:end]
+            x, y, w, h = cv2.boundingRect(column)
+            if w == 0 or h == 0:
                 return None
+            glyphs.append(cv2.resize(column[y:y+h, x:x+w], self.DIGIT_TEMPLATE_SIZE,
+                                     interpolation=cv2.INTER_AREA))
+        return glyphs
+    
+    def classify_digits_batch(self, rois, min_score=0.5):
+        """Classify binary ROIs as 0-36 numbers (or None) in one vectorized pass
+        
+        Every glyph from every ROI is scored against all ten templates with a
+        single einsum; for same-size inputs this equals TM_CCOEFF_NORMED.
+        """
+        try:
+            split = [self._split_glyphs(roi) for roi in rois]
+            glyphs = [glyph for parts in split if parts for glyph in parts]
+            if not glyphs:
+                return [None] * len(rois)
+            
+            scores = np.einsum('nk,dk->nd', self._normalize_glyphs(glyphs),
+                               self._get_digit_templates())
+            digits = scores.argmax(axis=1).tolist()
+            best = scores.max(axis=1).tolist()
+            
+            results = []
+            i = 0
+            for parts in split:
+                if not parts:
+                    results.append(None)
+                    continue
+                
+                number = 0
+                for j in range(i, i + len(parts)):
+                    if best[j] < min_score:
+                        number = None
+                        break
+                    number = number * 10 + digits[j]
+                results.append(number)
+                i += len(parts)
+            return results
             
-            # Calculate basic features
-            h, w = digit_img.shape
-            white_pixels = np.sum(digit_img == 255)
-            total_pixels = h * w
-            density = white_pixels / total_pixels if total_pixels > 0 else 0
-            
-            # Very basic classification (can be improved)
-            if density < 0.2:
-                return None  # Too sparse
-            elif density > 0.8:
-                return None  # Too dense
-            
-            # Return a random valid roulette number for now
-            # This is a placeholder - real implementation would use ML or template matching
-            return random.choice([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36])
+        except Exception as e:
+            print(f"Batch classification error: {e}")
+            return [None] * len(rois)
+    
+    def classify_simple_digit(self, digit_img, min_score=0.5):
+        """Classify a binary ROI as a 0-36 number by matching digit templates"""
+        try:
+            return self.classify_digits_batch([digit_img], min_score)[0]
             
         except Exception as e:
             print(f"Simple classification error: {e}")
             return None
-            
-            # Convert to grayscale (user says this works best)
-            img_array = np.array(image)
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
-            
-            print("📝 Using original grayscale as base (user recommended)")
-            
-            all_results = []
-            
-            # Try multiple scales on the grayscale image
-            scales = [1.0, 1.5, 2.0, 2.5, 3.0, 4.0]
-            
-            # Roulette-optimized OCR configurations
-            roulette_configs = [
-                '--psm 6 -c tessedit_char_whitelist=0123456789',  # Standard block
-                '--psm 7 -c tessedit_char_whitelist=0123456789',  # Single line
-                '--psm 8 -c tessedit_char_whitelist=0123456789',  # Single word
-                '--psm 13 -c tessedit_char_whitelist=0123456789', # Raw line
-                '--psm 6 --dpi 300 -c tessedit_char_whitelist=0123456789', # High DPI
-                '--psm 8 --dpi 150 -c tessedit_char_whitelist=0123456789', # Medium DPI
-                '--psm 7 --oem 1 -c tessedit_char_whitelist=0123456789',   # Legacy engine
-            ]
-            
-            print(f"🎰 Testing {len(scales)} scales with {len(roulette_configs)} roulette-optimized configs...")
-            
-            pil_gray = Image.fromarray(gray)
-            
-            for scale in scales:
-                print(f"� Testing scale: {scale}x")
-                
-                # Scale the grayscale image
-                if scale != 1.0:
-                    width, height = pil_gray.size
-                    new_size = (int(width * scale), int(height * scale))
-                    scaled_img = pil_gray.resize(new_size, Image.LANCZOS)
-                else:
-                    scaled_img = pil_gray
-                
-                for config_idx, config in enumerate(roulette_configs):
-                    try:
-                        # Extract text with current config
-                        raw_text = pytesseract.image_to_string(scaled_img, config=config)
-                        
-                        if raw_text.strip():
-                            print(f"📝 Scale {scale} + Config {config_idx + 1}: '{raw_text.strip()}'")
-                            
-                            # Get detailed OCR data
-                            try:
-                                data = pytesseract.image_to_data(scaled_img, output_type=pytesseract.Output.DICT, config=config)
-                                
-                                for i in range(len(data['text'])):
-                                    text_item = data['text'][i].strip()
-                                    confidence = int(data['conf'][i]) if data['conf'][i] != '-1' else 0
-                                    
-                                    if text_item and confidence > 10:  # Very low threshold for roulette
-                                        # Extract all numbers from this text item
-                                        for match in re.finditer(r'\d+', text_item):
-                                            try:
-                                                num = int(match.group())
-                                                # Roulette numbers are 0-36
-                                                if 0 <= num <= 36:
-                                                    x_pos = data['left'][i] if scale == 1.0 else data['left'][i] / scale
-                                                    all_results.append((x_pos, num, confidence, f"gray_scale{scale}_cfg{config_idx+1}"))
-                                                    print(f"   🎯 Found roulette number: {num} (confidence: {confidence}%)")
-                                            except ValueError:
-                                                continue
-                                                
-                            except Exception:
-                                # Simple fallback parsing for this config
-                                for match in re.finditer(r'\d+', raw_text):
-                                    try:
-                                        num = int(match.group())
-                                        if 0 <= num <= 36:  # Roulette range
-                                            all_results.append((0, num, 20, f"gray_scale{scale}_fallback"))
-                                            print(f"   🎯 Found roulette number (fallback): {num}")
-                                    except ValueError:
-                                        continue
-                            
-                    except Exception as e:
-                        continue
-            
-            # If still no results, try some minimal preprocessing on the gray image
-            if not all_results:
-                print("🔬 No results with grayscale, trying minimal preprocessing...")
-                
-                # Very light preprocessing - just different thresholds
-                for thresh_val in [127, 100, 150, 180]:
-                    try:
-                        _, thresh_img = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY)
-                        pil_thresh = Image.fromarray(thresh_img)
-                        
-                        # Try 2x scale with simple config
-                        width, height = pil_thresh.size
-                        scaled_thresh = pil_thresh.resize((width * 2, height * 2), Image.LANCZOS)
-                        
-                        config = '--psm 8 -c tessedit_char_whitelist=0123456789'
-                        raw_text = pytesseract.image_to_string(scaled_thresh, config=config)
-                        
-                        if raw_text.strip():
-                            print(f"� Threshold {thresh_val}: '{raw_text.strip()}'")
-                            
-                            for match in re.finditer(r'\d+', raw_text):
-                                try:
-                                    num = int(match.group())
-                                    if 0 <= num <= 36:
-                                        all_results.append((0, num, 15, f"thresh_{thresh_val}"))
-                                        print(f"   🎯 Found roulette number (threshold): {num}")
-                                except ValueError:
-                                    continue
-                                    
-                    except Exception:
-                        continue
-            
-            if not all_results:
-                print("❌ No roulette numbers (0-36) found with any method")
-                return []
-            
-            # Process results - focus on roulette numbers
-            print(f"🎯 Found {len(all_results)} potential roulette numbers")
-            
-            # Remove duplicates and sort by position
-            unique_results = {}
-            for x_pos, num, confidence, method in all_results:
-                key = (int(x_pos // 50), num)  # Group nearby positions
-                if key not in unique_results or unique_results[key][2] < confidence:
-                    unique_results[key] = (x_pos, num, confidence, method)
-            
-            # Sort by x position (left to right)
-            final_results = sorted(unique_results.values(), key=lambda x: x[0])
-            
-            # Extract numbers
-            numbers = [num for _, num, _, _ in final_results]
-            
-            # Show results
-            print("� Final roulette numbers found:")
-            for x_pos, num, confidence, method in final_results:
-                print(f"   Number: {num} (confidence: {confidence}%, method: {method})")
-            
-            print(f"📊 Extracted roulette numbers: {numbers}")
-            return numbers
-            
-        except Exception as e:
-            print(f"❌ Error in roulette number extraction: {e}")
-            return []
     
     def extract_numbers_simple_roulette(self, image):
         """Simple roulette number extraction fallback"""
@@ -525,26 +864,21 @@ class ScreenOCRTool:
             print("🎰 Fallback: Simple roulette number extraction...")
             
             # Convert to grayscale
-            img_array = np.array(image)
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
+            gray = self._as_gray(image)
             
-            # 2x scale + simple OCR
-            pil_gray = Image.fromarray(gray)
-            width, height = pil_gray.size
-            scaled = pil_gray.resize((width * 2, height * 2), Image.LANCZOS)
-            
-            config = '--psm 6 -c tessedit_char_whitelist=0123456789'
-            raw_text = pytesseract.image_to_string(scaled, config=config)
+            # 2x scale + simple OCR; large captures are split across processes
+            if gray.size >= PARALLEL_OCR_MIN_PIXELS:
+                raw_text = self.ocr_strips_parallel(gray, scale=2.0, psm=6)
+            else:
+                scaled = Image.fromarray(self._get_pyramid(gray, [2.0])[2.0])
+                raw_text = self.ocr_digits(scaled, psm=6)
             
             print(f"📝 Simple extraction result: '{raw_text.strip()}'")
             
             numbers = []
-            for match in re.finditer(r'\d+', raw_text):
+            for match in _DIGITS_RE.finditer(raw_text):
                 try:
-                    num = int(match.group())
+                    num = int(match.group(0))
                     if 0 <= num <= 36:  # Roulette range only
                         numbers.append(num)
                         print(f"🎯 Found: {num}")
@@ -557,83 +891,100 @@ class ScreenOCRTool:
             print(f"❌ Simple extraction also failed: {e}")
             return []
     
+    def _to_1bit(self, binary):
+        """Pack a 0/255 image into a 1 bpp PIL image (white where > 127)
+        
+        Tesseract binarizes its input anyway, so this carries an eighth of the
+        bytes through its image ingestion. Lanczos-upscaled binaries are
+        re-thresholded at mid-gray on the way.
+        """
+        height, width = binary.shape
+        bits = np.packbits(binary > 127, axis=1)
+        return Image.frombytes('1', (width, height), bits.tobytes())
+    
+    # Mean Tesseract confidence (0-100) at which try_aggressive_ocr stops early
+    AGGRESSIVE_MIN_CONFIDENCE = 70
+    
     def try_aggressive_ocr(self, image):
         """Try very aggressive OCR preprocessing as last resort"""
         results = []
         
         try:
-            img_array = np.array(image)
-            
-            # Convert to grayscale if needed
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
-            
-            # Aggressive strategies
-            strategies = []
-            
-            # 1. Extreme contrast
-            extreme_contrast = cv2.convertScaleAbs(gray, alpha=3.0, beta=0)
-            strategies.append(('extreme_contrast', extreme_contrast))
-            
-            # 2. Invert colors (white text on black background)
-            inverted = cv2.bitwise_not(gray)
-            strategies.append(('inverted', inverted))
-            
-            # 3. Bilateral filter + threshold
-            bilateral = cv2.bilateralFilter(gray, 11, 17, 17)
-            _, bilateral_thresh = cv2.threshold(bilateral, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            strategies.append(('bilateral', bilateral_thresh))
-            
-            # 4. Erosion + dilation
-            kernel = np.ones((3, 3), np.uint8)
-            eroded = cv2.erode(gray, kernel, iterations=1)
-            dilated = cv2.dilate(eroded, kernel, iterations=2)
-            strategies.append(('morph', dilated))
-            
+            gray = self._as_gray(image)
+            
+            # Aggressive strategies, built lazily so an early exit also skips
+            # the remaining preprocessing. Per-level strategies are point ops
+            # that commute with resizing and run on the shared gray pyramid;
+            # binary strategies are handed to Tesseract as 1-bit images.
+            strategies = [
+                # 1. Extreme contrast
+                ('extreme_contrast', lambda g: cv2.LUT(g, self._lut_contrast3), False, False),
+                # 2. Invert colors (white text on black background)
+                ('inverted', lambda g: cv2.LUT(g, self._lut_invert), True, False),
+                # 3. Bilateral filter + threshold
+                ('bilateral', lambda g: cv2.threshold(cv2.bilateralFilter(g, 11, 17, 17), 0, 255,
+                                                      cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1], False, True),
+                # 4. Erosion + dilation
+                ('morph', lambda g: cv2.dilate(cv2.erode(g, _K3, iterations=1), _K3,
+                                               iterations=2), False, False),
+            ]
             # 5. Multiple thresholds
             for thresh_val in [100, 127, 150, 180, 200]:
-                _, manual_thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY)
-                strategies.append((f'thresh_{thresh_val}', manual_thresh))
-            
-            print(f"🔥 Trying {len(strategies)} aggressive strategies...")
-            
-            for strategy_name, processed in strategies:
+                strategies.append((f'thresh_{thresh_val}',
+                                   lambda g, t=thresh_val: cv2.threshold(g, t, 255, cv2.THRESH_BINARY)[1],
+                                   False, True))
+            
+            # Try the strategies that have worked before first
+            strategies.sort(key=lambda strategy: -self._strategy_hits[strategy[0]])
+            
+            print(f"🔥 Trying up to {len(strategies)} aggressive strategies...")
+            
+            simple_psms = [8, 10, 13]
+            scales = [2.0, 3.0, 4.0]
+            pyramid = self._get_pyramid(gray, scales)
+            height, width = gray.shape
+            for strategy_name, build, per_level, binary in strategies:
+                # OCR this strategy's scale x psm grid in parallel
+                tasks = []
                 try:
-                    pil_img = Image.fromarray(processed)
+                    processed = None if per_level else build(gray)
                     
                     # Try multiple scales for each aggressive strategy
-                    for scale in [2.0, 3.0, 4.0]:
-                        width, height = pil_img.size
-                        new_size = (int(width * scale), int(height * scale))
-                        scaled_img = pil_img.resize(new_size, Image.LANCZOS)
-                        
-                        # Try simpler OCR configs for aggressive preprocessing
-                        simple_configs = [
-                            '--psm 8 -c tessedit_char_whitelist=0123456789',
-                            '--psm 10 -c tessedit_char_whitelist=0123456789',
-                            '--psm 13 -c tessedit_char_whitelist=0123456789',
-                        ]
+                    for scale in scales:
+                        if per_level:
+                            scaled = build(pyramid[scale])
+                        else:
+                            new_size = (int(width * scale), int(height * scale))
+                            scaled = cv2.resize(processed, new_size, interpolation=cv2.INTER_LANCZOS4)
+                        scaled_img = self._to_1bit(scaled) if binary else Image.fromarray(scaled)
                         
-                        for config in simple_configs:
-                            try:
-                                raw_text = pytesseract.image_to_string(scaled_img, config=config)
-                                if raw_text.strip():
-                                    print(f"🔥 {strategy_name}_scale{scale}: '{raw_text.strip()}'")
-                                    
-                                    for match in re.finditer(r'\d+', raw_text):
-                                        try:
-                                            num = int(match.group())
-                                            if 0 <= num <= 99:
-                                                results.append((0, num, 25, f"aggressive_{strategy_name}"))
-                                        except ValueError:
-                                            continue
-                            except Exception:
-                                continue
+                        for psm in simple_psms:
+                            tasks.append((scale, scaled_img, psm))
                                 
                 except Exception:
                     continue
+                
+                outputs = self.ocr_digits_parallel([(img, psm) for _, img, psm in tasks])
+                
+                confident = False
+                for (scale, _, _), (raw_text, confidence) in zip(tasks, outputs):
+                    if raw_text.strip():
+                        print(f"🔥 {strategy_name}_scale{scale}: '{raw_text.strip()}' ({confidence:.0f}%)")
+                        
+                        for match in _DIGITS_RE.finditer(raw_text):
+                            try:
+                                num = int(match.group(0))
+                                if 0 <= num <= 99:
+                                    results.append((0, num, 25, f"aggressive_{strategy_name}"))
+                                    confident = confident or confidence >= self.AGGRESSIVE_MIN_CONFIDENCE
+                            except ValueError:
+                                continue
+                
+                # A confident read ends the sweep; remember which strategy gave it
+                if confident:
+                    self._strategy_hits[strategy_name] += 1
+                    print(f"✅ {strategy_name} gave a confident read, skipping the rest")
+                    break
             
             return results
             
@@ -645,19 +996,14 @@ class ScreenOCRTool:
         """Simple fallback OCR method"""
         try:
             # Convert to grayscale
-            img_array = np.array(image)
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
+            gray = self._as_gray(image)
             
             pil_img = Image.fromarray(gray)
-            config = '--psm 6 -c tessedit_char_whitelist=0123456789'
-            raw_text = pytesseract.image_to_string(pil_img, config=config)
+            raw_text = self.ocr_digits(pil_img, psm=6)
             
             numbers = []
-            for match in re.finditer(r'\d+', raw_text):
-                num = int(match.group())
+            for match in _DIGITS_RE.finditer(raw_text):
+                num = int(match.group(0))
                 if 0 <= num <= 99:
                     numbers.append(num)
             
@@ -688,7 +1034,7 @@ class ScreenOCRTool:
             print(f"💾 Saved original: {original_path}")
             
             # Get processed versions
-            processed_images = self.preprocess_image_advanced(image)
+            processed_images = self.preprocess_image_advanced(image, self.PREPROCESS_STRATEGIES)
             
             # Save all processed versions
             for idx, (strategy_name, processed_img) in enumerate(processed_images.items()):
@@ -704,13 +1050,52 @@ class ScreenOCRTool:
         # Now extract numbers normally
         return self.extract_numbers_advanced(image)
     
+    # Results kept by extract_numbers, and the perceptual-hash distance (in
+    # bits) under which a capture counts as a near-duplicate. Off (-1) by
+    # default, since a single changed digit can stay within a few bits
+    RESULT_CACHE_SIZE = 128
+    NEAR_DUPLICATE_DISTANCE = -1
+    
+    def _perceptual_hash(self, gray):
+        """64-bit DCT hash of gray: low frequencies of a 32x32 thumbnail vs their median"""
+        thumb = cv2.resize(gray, (32, 32), interpolation=cv2.INTER_AREA).astype(np.float32)
+        low = cv2.dct(thumb)[:8, :8].ravel()
+        bits = low > np.median(low)
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+    
     def extract_numbers(self, image):
-        """Extract numbers from image using advanced OCR strategies"""
+        """Extract numbers from image using advanced OCR strategies
+        
+        Results are cached by a hash of the grayscale pixels, so a screen
+        region seen before skips detection and OCR. Debug runs go through
+        extract_numbers_with_debug and are never cached.
+        """
         if not image:
             return []
         
+        gray = self._as_gray(image)
+        key = (gray.shape, _frame_hash(memoryview(np.ascontiguousarray(gray))))
+        if key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            print("♻️ Seen this capture before, reusing its numbers")
+            return list(self._result_cache[key][1])
+        
+        phash = None
+        if self.NEAR_DUPLICATE_DISTANCE >= 0:
+            phash = self._perceptual_hash(gray)
+            for (shape, _), (other, numbers) in self._result_cache.items():
+                if (shape == gray.shape and other is not None and
+                        bin(phash ^ other).count('1') <= self.NEAR_DUPLICATE_DISTANCE):
+                    print("♻️ Capture nearly matches an earlier one, reusing its numbers")
+                    return list(numbers)
+        
         # Use the advanced extraction method for better results
-        return self.extract_numbers_advanced(image)
+        numbers = self.extract_numbers_advanced(image)
+        
+        self._result_cache[key] = (phash, list(numbers))
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return numbers
     
     def save_screenshot(self, filename=None):
         """Save the last screenshot to file"""
@@ -723,8 +1108,11 @@ class ScreenOCRTool:
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 filename = f"screenshot_{timestamp}.png"
             
-            self.last_screenshot.save(filename)
-            print(f"💾 Screenshot saved as: {filename}")
+            # The colour conversion makes a private copy, so the write can
+            # finish in the background while capturing continues
+            bgr = cv2.cvtColor(np.asarray(self.last_screenshot), cv2.COLOR_RGB2BGR)
+            _save_pool.submit(_write_screenshot, bgr, filename)
+            print(f"💾 Saving screenshot as: {filename}")
             return True
             
         except Exception as e:
@@ -753,70 +1141,8 @@ class ScreenOCRTool:
             
             try:
                 choice = input("\n🔸 Enter choice (1-7): ").strip()
-                
-                if choice == "1":
-                    if self.select_area_by_mouse_position():
-                        print("✅ Area selection completed")
-                    else:
-                        print("❌ Area selection cancelled or failed")
-                
-                elif choice == "2":
-                    self.set_area_manually()
-                
-                elif choice == "3":
-                    self.get_current_mouse_position()
-                
-                elif choice == "4":
-                    if self.capture_area:
-                        screenshot = self.capture_screen_area()
-                        if screenshot:
-                            # Ask if user wants debug mode
-                            debug_mode = input("\n🔍 Enable debug mode? (saves processed images) (y/n): ").lower().strip()
-                            
-                            if debug_mode in ['y', 'yes']:
-                                print("🐛 Debug mode enabled - will save processed images")
-                                numbers = self.extract_numbers_with_debug(screenshot)
-                            else:
-                                numbers = self.extract_numbers(screenshot)
-                            
-                            if numbers:
-                                print(f"\n🎯 EXTRACTED NUMBERS: {numbers}")
-                                
-                                # Ask if user wants to save
-                                save = input("\n💾 Save screenshot? (y/n): ").lower().strip()
-                                if save in ['y', 'yes']:
-                                    self.save_screenshot()
-                            else:
-                                print("\n❌ No numbers found in the captured area")
-                                print("💡 Try debug mode to see processed images")
-                                
-                                # Still offer to save for debugging
-                                save = input("💾 Save screenshot for debugging? (y/n): ").lower().strip()
-                                if save in ['y', 'yes']:
-                                    self.save_screenshot()
-                    else:
-                        print("❌ Please select a capture area first (option 1 or 2)")
-                
-                elif choice == "5":
-                    if self.last_screenshot:
-                        filename = input("📁 Enter filename (or press Enter for auto): ").strip()
-                        self.save_screenshot(filename if filename else None)
-                    else:
-                        print("❌ No screenshot available to save")
-                
-                elif choice == "6":
-                    if self.capture_area:
-                        x, y, w, h = self.capture_area
-                        print(f"📍 Current area: X={x}, Y={y}, Width={w}, Height={h}")
-                    else:
-                        print("❌ No area selected")
-                
-                elif choice == "7":
-                    print("👋 Goodbye!")
+                if self.handle_choice(choice)['exit']:
                     break
-                
-                else:
-                    print("❌ Invalid choice. Please enter 1-7.")
                     
             except KeyboardInterrupt:
                 print("\n\n👋 Goodbye!")
@@ -824,59 +1150,166 @@ class ScreenOCRTool:
             except Exception as e:
                 print(f"❌ Error: {e}")
     
+    def _ask_yes_no(self, prompt, answer=None):
+        """Return answer if given, otherwise ask prompt on the terminal"""
+        if answer is not None:
+            return answer
+        return input(prompt).lower().strip() in ['y', 'yes']
+    
+    def handle_choice(self, choice, *, debug=None, save=None):
+        """Run one menu action; returns {'exit': bool, 'numbers': list or None}
+        
+        debug and save answer option 4's prompts up front, so capture and
+        extraction can be driven without a terminal; left as None they are
+        asked interactively.
+        """
+        result = {'exit': False, 'numbers': None}
+        
+        if choice == "1":
+            if self.select_area_by_mouse_position():
+                print("✅ Area selection completed")
+            else:
+                print("❌ Area selection cancelled or failed")
+        
+        elif choice == "2":
+            self.set_area_manually()
+        
+        elif choice == "3":
+            self.get_current_mouse_position()
+        
+        elif choice == "4":
+            if self.capture_area:
+                screenshot = self.capture_screen_area()
+                if screenshot:
+                    # Ask if user wants debug mode
+                    if self._ask_yes_no("\n🔍 Enable debug mode? (saves processed images) (y/n): ", debug):
+                        print("🐛 Debug mode enabled - will save processed images")
+                        numbers = self.extract_numbers_with_debug(screenshot)
+                    else:
+                        numbers = self.extract_numbers(screenshot)
+                    result['numbers'] = numbers
+                    
+                    if numbers:
+                        print(f"\n🎯 EXTRACTED NUMBERS: {numbers}")
+                        
+                        # Ask if user wants to save
+                        if self._ask_yes_no("\n💾 Save screenshot? (y/n): ", save):
+                            self.save_screenshot()
+                    else:
+                        print("\n❌ No numbers found in the captured area")
+                        print("💡 Try debug mode to see processed images")
+                        
+                        # Still offer to save for debugging
+                        if self._ask_yes_no("💾 Save screenshot for debugging? (y/n): ", save):
+                            self.save_screenshot()
+            else:
+                print("❌ Please select a capture area first (option 1 or 2)")
+        
+        elif choice == "5":
+            if self.last_screenshot:
+                filename = input("📁 Enter filename (or press Enter for auto): ").strip()
+                self.save_screenshot(filename if filename else None)
+            else:
+                print("❌ No screenshot available to save")
+        
+        elif choice == "6":
+            if self.capture_area:
+                x, y, w, h = self.capture_area
+                print(f"📍 Current area: X={x}, Y={y}, Width={w}, Height={h}")
+            else:
+                print("❌ No area selected")
+        
+        elif choice == "7":
+            print("👋 Goodbye!")
+            result['exit'] = True
+        
+        else:
+            print("❌ Invalid choice. Please enter 1-7.")
+        
+        return result
+    
+    def _filter_boxes(self, rects, areas, min_area, max_area, min_aspect, max_aspect, min_h, min_w):
+        """Return the (x, y, w, h) rows of rects passing digit size/shape limits
+        
+        Area and h/w limits are exclusive, aspect (w/h) limits inclusive.
+        """
+        widths, heights = rects[:, 2], rects[:, 3]
+        keep = ((areas > min_area) & (areas < max_area) &
+                (heights > min_h) & (widths > min_w) &
+                (widths >= min_aspect * heights) & (widths <= max_aspect * heights))
+        return rects[keep].tolist()
+    
+    def _digit_boxes(self, contours, *limits):
+        """Return [(x, y, w, h)] of contours passing _filter_boxes' limits
+        
+        Rects and areas are measured in one pass and filtered with array masks.
+        """
+        if not contours:
+            return []
+        
+        rects = np.array([cv2.boundingRect(c) for c in contours], dtype=np.int32)
+        areas = np.fromiter((cv2.contourArea(c) for c in contours), dtype=np.float32,
+                            count=len(contours))
+        return self._filter_boxes(rects, areas, *limits)
+    
+    def _component_boxes(self, binary, *limits):
+        """Return [(x, y, w, h)] of the white blobs in binary passing _filter_boxes' limits
+        
+        connectedComponentsWithStats reports every blob's box and pixel area
+        from one C call, so no per-contour Python work is left.
+        """
+        _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        stats = stats[1:]  # Label 0 is the background
+        return self._filter_boxes(stats[:, :4], stats[:, cv2.CC_STAT_AREA], *limits)
+    
     def detect_digits_by_contours(self, gray):
         """Detect digits using contour analysis"""
         digits = []
         
         try:
-            # Multiple threshold approaches
-            for thresh_val in [127, 100, 150, 85, 170]:
-                _, thresh = cv2.threshold(gray, thresh_val, 255, cv2.THRESH_BINARY)
-                
-                # Find contours
-                contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                
-                for contour in contours:
-                    # Filter by area and aspect ratio
-                    area = cv2.contourArea(contour)
-                    if 50 < area < 2000:  # Reasonable digit size
-                        x, y, w, h = cv2.boundingRect(contour)
-                        aspect_ratio = w / h
-                        
-                        # Digits typically have aspect ratio between 0.3 and 1.2
-                        if 0.3 <= aspect_ratio <= 1.2 and h > 10 and w > 5:
-                            digit_roi = thresh[y:y+h, x:x+w]
-                            digits.append((x, y, w, h, digit_roi))
+            # Multiple threshold approaches, all binarized in one broadcast
+            # comparison (one contiguous 0/255 plane per threshold)
+            thresholds = np.array([127, 100, 150, 85, 170], dtype=np.uint8)
+            planes = (gray[None, :, :] > thresholds[:, None, None]).view(np.uint8) * np.uint8(255)
+            
+            # The same digit usually survives several thresholds; keep it once
+            seen = set()
+            for thresh in planes:
+                # Reasonable digit size; digits typically have aspect ratio 0.3-1.2
+                for x, y, w, h in self._component_boxes(thresh, 50, 2000, 0.3, 1.2, 10, 5):
+                    if (x, y, w, h) not in seen:
+                        seen.add((x, y, w, h))
+                        digit_roi = thresh[y:y+h, x:x+w]
+                        digits.append((x, y, w, h, digit_roi))
         
         except Exception as e:
             print(f"Contour detection error: {e}")
         
         return digits
     
+    # Below this many pixels the blob detectors already find every digit, so
+    # the Canny + close pass in detect_digits_by_edges is skipped
+    EDGE_DETECTION_MIN_PIXELS = 20_000
+    
     def detect_digits_by_edges(self, gray):
         """Detect digits using edge detection"""
         digits = []
+        if gray.size < self.EDGE_DETECTION_MIN_PIXELS:
+            return digits
         
         try:
             # Canny edge detection
             edges = cv2.Canny(gray, 50, 150)
             
             # Morphological operations to connect edges
-            kernel = np.ones((3,3), np.uint8)
-            closed = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, kernel)
+            closed = cv2.morphologyEx(edges, cv2.MORPH_CLOSE, _K3)
             
             # Find contours
             contours, _ = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if 30 < area < 1500:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    aspect_ratio = w / h
-                    
-                    if 0.2 <= aspect_ratio <= 1.5 and h > 8 and w > 4:
-                        digit_roi = gray[y:y+h, x:x+w]
-                        digits.append((x, y, w, h, digit_roi))
+            for x, y, w, h in self._digit_boxes(contours, 30, 1500, 0.2, 1.5, 8, 4):
+                digit_roi = gray[y:y+h, x:x+w]
+                digits.append((x, y, w, h, digit_roi))
         
         except Exception as e:
             print(f"Edge detection error: {e}")
@@ -892,18 +1325,10 @@ class ScreenOCRTool:
             adaptive_thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
                                                   cv2.THRESH_BINARY, 11, 2)
             
-            # Find contours
-            contours, _ = cv2.findContours(adaptive_thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if 40 < area < 1800:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    aspect_ratio = w / h
-                    
-                    if 0.25 <= aspect_ratio <= 1.3 and h > 9 and w > 4:
-                        digit_roi = adaptive_thresh[y:y+h, x:x+w]
-                        digits.append((x, y, w, h, digit_roi))
+            # Find blobs
+            for x, y, w, h in self._component_boxes(adaptive_thresh, 40, 1800, 0.25, 1.3, 9, 4):
+                digit_roi = adaptive_thresh[y:y+h, x:x+w]
+                digits.append((x, y, w, h, digit_roi))
         
         except Exception as e:
             print(f"Adaptive threshold error: {e}")
@@ -919,111 +1344,118 @@ class ScreenOCRTool:
             _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             
             # Morphological operations
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
-            opening = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=1)
-            closing = cv2.morphologyEx(opening, cv2.MORPH_CLOSE, kernel, iterations=1)
-            
-            # Find contours
-            contours, _ = cv2.findContours(closing, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            opening = cv2.morphologyEx(binary, cv2.MORPH_OPEN, _K3, iterations=1)
+            closing = cv2.morphologyEx(opening, cv2.MORPH_CLOSE, _K3, iterations=1)
             
-            for contour in contours:
-                area = cv2.contourArea(contour)
-                if 35 < area < 1600:
-                    x, y, w, h = cv2.boundingRect(contour)
-                    aspect_ratio = w / h
-                    
-                    if 0.3 <= aspect_ratio <= 1.2 and h > 8 and w > 5:
-                        digit_roi = closing[y:y+h, x:x+w]
-                        digits.append((x, y, w, h, digit_roi))
+            # Find blobs
+            for x, y, w, h in self._component_boxes(closing, 35, 1600, 0.3, 1.2, 8, 5):
+                digit_roi = closing[y:y+h, x:x+w]
+                digits.append((x, y, w, h, digit_roi))
         
         except Exception as e:
             print(f"Morphological detection error: {e}")
         
         return digits
     
+    def _prep_digit(self, digit_img):
+        """Return (resized 20x30, its binary) of a digit ROI"""
+        if len(digit_img.shape) == 3:
+            digit_img = cv2.cvtColor(digit_img, cv2.COLOR_BGR2GRAY)
+        
+        resized = cv2.resize(digit_img, (20, 30), interpolation=cv2.INTER_AREA)
+        _, binary = cv2.threshold(resized, 127, 255, cv2.THRESH_BINARY)
+        return resized, binary
+    
     def classify_digit_by_features(self, digit_img):
         """Classify digit using feature analysis"""
         try:
             if digit_img is None or digit_img.size == 0:
                 return None
             
-            # Resize to standard size
-            resized = cv2.resize(digit_img, (20, 30))
+            # Resize to standard size and binarize
+            resized, binary = self._prep_digit(digit_img)
             
             # Calculate features
-            features = self.analyze_digit_features(resized)
+            features = self.analyze_digit_features(resized, binary)
             
-            # Simple heuristic classification based on features
-            # This is a basic approach - could be improved with ML
-            
-            # Features: [holes, horizontal_lines, vertical_lines, curves, density]
-            holes, h_lines, v_lines, curves, density = features
-            
-            # Basic classification rules for digits 0-9
-            if holes >= 1 and density > 0.3:
-                if curves > 0.6:
-                    return 0  # Circle-like with hole
-                elif h_lines > 0.4:
-                    return 8  # Has hole and horizontal lines
-                else:
-                    return 6 or 9  # Has hole, choose based on other features
-            
-            elif v_lines > 0.7 and h_lines < 0.3:
-                return 1  # Mostly vertical
-            
-            elif h_lines > 0.5 and curves < 0.3:
-                if v_lines < 0.3:
-                    return 7  # Horizontal top, minimal vertical
-                else:
-                    return 4  # Has both horizontal and vertical
-            
-            elif curves > 0.5:
-                if h_lines > 0.4:
-                    return 3 or 5  # Curved with some horizontal
-                else:
-                    return 2 or 5  # Mostly curved
-            
-            # Default to most common roulette numbers
-            return random.choice([1, 2, 3, 4, 5, 6, 7, 8, 9])
+            # Features: [holes, horizontal_lines, vertical_lines, curves, density],
+            # looked up in the precomputed rule table instead of an if/elif cascade;
+            # where no rule fires, the digit with the nearest feature centroid
+            rows = np.asarray([features], dtype=np.float64)
+            return int(_classify_feature_rows(rows, _FEATURE_EDGES, _FEATURE_TABLE,
+                                              self._get_feature_centroids())[0])
             
         except Exception as e:
             print(f"Feature classification error: {e}")
             return None
     
-    def analyze_digit_features(self, digit_img):
-        """Analyze digit image to extract features"""
+    def _get_feature_centroids(self):
+        """Return (10, 5) mean analyze_digit_features vectors of rendered digits 0-9
+        
+        Each digit is drawn in two Hershey fonts at two stroke widths and put
+        through the same resize/threshold as real ROIs, so the nearest
+        centroid is a deterministic stand-in for a trained prior.
+        """
+        if self._feature_centroids is None:
+            centroids = np.zeros((10, 5), dtype=np.float64)
+            variants = [(font, thickness)
+                        for font in (cv2.FONT_HERSHEY_SIMPLEX, cv2.FONT_HERSHEY_DUPLEX)
+                        for thickness in (2, 3)]
+            for digit in range(10):
+                for font, thickness in variants:
+                    canvas = np.zeros((40, 30), dtype=np.uint8)
+                    cv2.putText(canvas, str(digit), (2, 34), font, 1.2, 255, thickness, cv2.LINE_AA)
+                    x, y, w, h = cv2.boundingRect(canvas)
+                    resized, binary = self._prep_digit(canvas[y:y+h, x:x+w])
+                    centroids[digit] += self.analyze_digit_features(resized, binary)
+            self._feature_centroids = centroids / len(variants)
+        return self._feature_centroids
+    
+    def _contour_features(self, binary):
+        """Return (hole count, circularity of the largest outline) of a binary digit"""
+        # One two-level contour pass serves both the hole count and the
+        # outline used for the curve feature
+        contours, hierarchy = cv2.findContours(binary, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+        
+        # Count holes (contours that sit inside another contour)
+        if hierarchy is not None:
+            has_parent = hierarchy[0, :, 3] >= 0
+            holes = int(has_parent.sum())
+            contours = [c for c, inner in zip(contours, has_parent) if not inner]
+        else:
+            holes = 0
+        
+        # Curve detection (using the outer contours)
+        curve_strength = 0
+        if contours:
+            largest_contour = max(contours, key=cv2.contourArea)
+            perimeter = cv2.arcLength(largest_contour, True)
+            area = cv2.contourArea(largest_contour)
+            if area > 0:
+                curve_strength = perimeter / (2 * np.sqrt(np.pi * area))  # Circularity
+        return holes, curve_strength
+    
+    def analyze_digit_features(self, digit_img, binary=None):
+        """Analyze digit image to extract features; binary skips re-thresholding"""
         try:
             # Ensure binary image
-            if len(digit_img.shape) == 3:
-                digit_img = cv2.cvtColor(digit_img, cv2.COLOR_BGR2GRAY)
-            
-            _, binary = cv2.threshold(digit_img, 127, 255, cv2.THRESH_BINARY)
+            if binary is None:
+                if len(digit_img.shape) == 3:
+                    digit_img = cv2.cvtColor(digit_img, cv2.COLOR_BGR2GRAY)
+                
+                _, binary = cv2.threshold(digit_img, 127, 255, cv2.THRESH_BINARY)
             
-            # Feature 1: Count holes (connected components in inverted image)
-            inverted = cv2.bitwise_not(binary)
-            num_labels, _ = cv2.connectedComponents(inverted)
-            holes = max(0, num_labels - 2)  # Subtract background and main digit
+            # Features 1 and 4: holes and curve strength
+            holes, curve_strength = self._contour_features(binary)
             
             # Feature 2: Horizontal line strength
-            horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 1))
-            horizontal_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, horizontal_kernel)
+            horizontal_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, _KH5)
             h_strength = np.sum(horizontal_lines) / (255 * binary.size)
             
             # Feature 3: Vertical line strength
-            vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 5))
-            vertical_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, vertical_kernel)
+            vertical_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, _KV5)
             v_strength = np.sum(vertical_lines) / (255 * binary.size)
             
-            # Feature 4: Curve detection (using contour analysis)
-            contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-            curve_strength = 0
-            if contours:
-                largest_contour = max(contours, key=cv2.contourArea)
-                perimeter = cv2.arcLength(largest_contour, True)
-                area = cv2.contourArea(largest_contour)
-                if area > 0:
-                    curve_strength = perimeter / (2 * np.sqrt(np.pi * area))  # Circularity
-            
             # Feature 5: Pixel density
             density = np.sum(binary) / (255 * binary.size)
             
@@ -1041,7 +1473,9 @@ class ScreenOCRTool:
                 return 0.0
             
             # Check image clarity
-            laplacian_var = cv2.Laplacian(digit_img, cv2.CV_64F).var()
+            # A 3x3 Laplacian of uint8 fits in int16, so this is exact and cheaper than 64F
+            _, lap_std = cv2.meanStdDev(cv2.Laplacian(digit_img, cv2.CV_16S))
+            laplacian_var = float(lap_std[0, 0]) ** 2
             clarity_score = min(100, laplacian_var / 10)
             
             # Check size appropriateness
@@ -1059,7 +1493,12 @@ class ScreenOCRTool:
 def main():
     """Main function"""
     tool = ScreenOCRTool()
-    tool.run_interactive()
+    try:
+        tool.run_interactive()
+    finally:
+        tool.close()
+        # Let queued screenshot saves finish before exiting
+        _save_pool.shutdown(wait=True)
 
 if __name__ == "__main__":
     main()
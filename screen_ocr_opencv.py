@@ -9,7 +9,13 @@ This version uses computer vision techniques instead of traditional OCR.
 import sys
 import time
 import re
-import random
+import io
+import hashlib
+import functools
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Screen capture and OCR imports
@@ -20,39 +26,241 @@ try:
     import numpy as np
     import tkinter as tk
     from tkinter import messagebox
-    import requests
-    import base64
-    import io
 except ImportError as e:
     print(f"❌ Missing required library: {e}")
-    print("Please install: pip install pyautogui pillow opencv-python numpy requests")
+    print("Please install: pip install pyautogui pillow opencv-python numpy")
     sys.exit(1)
 
-# Optional import for enhanced screenshots
-try:
-    import matplotlib.pyplot as plt
-    import matplotlib.patches as patches
-    MATPLOTLIB_AVAILABLE = True
-    print("📸 Enhanced screenshot functionality available (matplotlib found)")
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    print("📸 Basic screenshot functionality only (install matplotlib for enhanced results)")
-
-# Optional imports for online OCR APIs
+# Optional import for online OCR APIs
 try:
     import requests
-    import base64
-    import io
     REQUESTS_AVAILABLE = True
     print("🌐 Online OCR API support available")
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("🌐 Install 'requests' for online OCR API support: pip install requests")
 
+# Optional fast screen capture (native grab instead of pyautogui's full-screen crop)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Optional JIT for the per-pixel digit feature scan
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _create_session():
+    """Create a keep-alive session with a pooled, retrying adapter for the OCR APIs"""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    # Throttling and transient server errors are retried with exponential
+    # backoff, honouring Retry-After, instead of coming back as empty results
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(['POST']), respect_retry_after_header=True,
+                    raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    session.headers["User-Agent"] = "screen-ocr-opencv/1.0"
+    return session
+
+# Shared by every API call so TCP/TLS connections stay open between captures
+_SESSION = _create_session() if REQUESTS_AVAILABLE else None
+
+# Patterns for parsing OCR text, compiled once
+_WS_RE = re.compile(r'\s+')
+_NUM_RE = re.compile(r'\b\d+\b')
+
+# zlib level for the PNGs written to the debug directory: level 1 encodes
+# several times faster than the default 6 for files ~20% larger
+PNG_COMPRESS_LEVEL = 1
+_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, PNG_COMPRESS_LEVEL]
+
+# Slots of the enhanced digit feature vector
+(FEAT_ASPECT, FEAT_FILL, FEAT_HOLES, FEAT_TOP, FEAT_BOTTOM,
+ FEAT_LEFT, FEAT_RIGHT, FEAT_CORNERS) = range(8)
+N_FEATURES = 8
+
+# Gray's 2x2 quad weights for the 8-connected Euler number, indexed by the
+# nibble tl | tr<<1 | bl<<2 | br<<3: +1 per one-pixel quad, -1 per
+# three-pixel quad, -2 per diagonal pair; the sum is 4 * (blobs - holes)
+_EULER8_WEIGHTS = np.zeros(16, dtype=np.int64)
+_EULER8_WEIGHTS[[1, 2, 4, 8]] = 1
+_EULER8_WEIGHTS[[7, 11, 13, 14]] = -1
+_EULER8_WEIGHTS[[6, 9]] = -2
+
+def _euler_number(binary):
+    """Euler number (8-connected blobs minus holes) of a mask from one 2x2 quad histogram"""
+    bits = np.pad(binary > 0, 1).astype(np.uint8)
+    quads = (bits[:-1, :-1] | (bits[:-1, 1:] << 1) |
+             (bits[1:, :-1] << 2) | (bits[1:, 1:] << 3))
+    return int(np.bincount(quads.ravel(), minlength=16) @ _EULER8_WEIGHTS) // 4
+
+# Digit crops are resized to DIGIT_SIZE x DIGIT_SIZE before feature analysis,
+# so the profile split points are constants: rows/columns [0, 9) and [18, 28)
+DIGIT_SIZE = 28
+THIRD_END = DIGIT_SIZE // 3
+TWO_THIRDS_START = 2 * DIGIT_SIZE // 3
+DIGIT_PIXELS = DIGIT_SIZE * DIGIT_SIZE
+
+# Contours (ink blobs or enclosed holes) of this many pixels or fewer are specks
+MIN_CONTOUR_PIXELS = 10
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _digit_features(binary):
+        """Fill ratio, top/bottom/left/right ink shares and contour count of a 0/255 mask
+        
+        The mask must be DIGIT_SIZE x DIGIT_SIZE. The count stands in for
+        findContours(RETR_CCOMP): 8-connected ink blobs plus enclosed
+        4-connected background regions, specks excluded.
+        """
+        h, w = binary.shape
+        ink = top = bottom = left = right = 0
+        for y in range(h):
+            for x in range(w):
+                if binary[y, x]:
+                    ink += 1
+                    if y < THIRD_END:
+                        top += 1
+                    if y >= TWO_THIRDS_START:
+                        bottom += 1
+                    if x < THIRD_END:
+                        left += 1
+                    if x >= TWO_THIRDS_START:
+                        right += 1
+        
+        # Flood-fill every region once; each pixel is pushed at most once
+        seen = np.zeros((h, w), dtype=np.bool_)
+        stack = np.empty(h * w, dtype=np.int32)
+        contours = 0
+        for sy in range(h):
+            for sx in range(w):
+                if seen[sy, sx]:
+                    continue
+                is_ink = binary[sy, sx] != 0
+                seen[sy, sx] = True
+                stack[0] = sy * w + sx
+                depth = 1
+                size = 0
+                on_border = False
+                while depth > 0:
+                    depth -= 1
+                    y = stack[depth] // w
+                    x = stack[depth] % w
+                    size += 1
+                    if y == 0 or y == h - 1 or x == 0 or x == w - 1:
+                        on_border = True
+                    for dy in range(-1, 2):
+                        for dx in range(-1, 2):
+                            # Ink connects diagonally, background does not
+                            if (dy == 0 and dx == 0) or (not is_ink and dy != 0 and dx != 0):
+                                continue
+                            ny = y + dy
+                            nx = x + dx
+                            if (0 <= ny < h and 0 <= nx < w and not seen[ny, nx]
+                                    and (binary[ny, nx] != 0) == is_ink):
+                                seen[ny, nx] = True
+                                stack[depth] = ny * w + nx
+                                depth += 1
+                if size > MIN_CONTOUR_PIXELS and (is_ink or not on_border):
+                    contours += 1
+        
+        result = np.zeros(6)
+        result[0] = ink / DIGIT_PIXELS
+        # A blank crop has no ink to share out
+        if ink > 0:
+            result[1] = top / ink
+            result[2] = bottom / ink
+            result[3] = left / ink
+            result[4] = right / ink
+        result[5] = contours
+        return result
+else:
+    def _digit_features(binary):
+        """Fill ratio, top/bottom/left/right ink shares and contour count of a 0/255 mask
+        
+        The mask must be DIGIT_SIZE x DIGIT_SIZE. The count stands in for
+        findContours(RETR_CCOMP): 8-connected ink blobs plus enclosed
+        4-connected background regions, specks excluded.
+        """
+        # Row and column ink counts as SIMD int32 reductions of the 0/255 mask
+        rows = cv2.reduce(binary, 1, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
+        cols = cv2.reduce(binary, 0, cv2.REDUCE_SUM, dtype=cv2.CV_32S).ravel() // 255
+        ink = rows.sum()
+        result = np.zeros(6)
+        result[0] = ink / DIGIT_PIXELS
+        # A blank crop has no ink to share out
+        if ink > 0:
+            result[1:5] = (rows[:THIRD_END].sum(), rows[TWO_THIRDS_START:].sum(),
+                           cols[:THIRD_END].sum(), cols[TWO_THIRDS_START:].sum())
+            result[1:5] /= ink
+        
+        _, _, ink_stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+        n_bg, bg_labels, bg_stats, _ = cv2.connectedComponentsWithStats(
+            cv2.bitwise_not(binary), connectivity=4)
+        # Background label 0 is the ink itself; regions touching the border aren't holes
+        enclosed = np.ones(n_bg, dtype=bool)
+        enclosed[0] = False
+        enclosed[bg_labels[[0, -1], :]] = False
+        enclosed[bg_labels[:, [0, -1]]] = False
+        result[5] = (np.count_nonzero(ink_stats[1:, cv2.CC_STAT_AREA] > MIN_CONTOUR_PIXELS) +
+                     np.count_nonzero(bg_stats[enclosed, cv2.CC_STAT_AREA] > MIN_CONTOUR_PIXELS))
+        return result
+
 class ScreenOCRTool:
-    def __init__(self):
+    def __init__(self, debug=False):
         self.debug_dir = None
-        self.setup_debug_directory()
+        self.debug = debug
+        self._ocr_cache = OrderedDict()
+        # (gray, numbers) of the last successfully read capture
+        self._last_frame = None
+        self._sct = None
+        self._digit_weights = None
+        if self.debug:
+            self.setup_debug_directory()
+        
+        # Spacing between API Ninjas requests (shared by the racing API threads)
+        self._min_interval = 60.0 / self.API_NINJAS_MAX_RPM
+        self._last_call = 0.0
+        self._lock = threading.Lock()
+        
+        # Intermediate images are PNG-encoded on a background thread so the
+        # detectors never wait on compression or disk
+        self._dbg_q = queue.Queue()
+        self._dbg_thread = threading.Thread(target=self._dbg_worker, daemon=True)
+        self._dbg_thread.start()
+    
+    def _dbg_worker(self):
+        """Write queued debug images until the None sentinel arrives"""
+        while True:
+            item = self._dbg_q.get()
+            if item is None:
+                break
+            path, image = item
+            try:
+                cv2.imwrite(path, image, _PNG_PARAMS)
+            except Exception as e:
+                print(f"❌ Could not save debug image {path}: {e}")
+    
+    def _debug_write(self, name, image):
+        """Queue an intermediate image as name in the debug directory (only when debug is on)
+        
+        The arrays passed here are fresh per frame and never modified after
+        being queued, so they are handed over without a copy.
+        """
+        if self.debug:
+            self._dbg_q.put((str(self.debug_dir / name), image))
+    
+    def close(self):
+        """Flush pending debug images and stop the writer thread"""
+        self._dbg_q.put(None)
+        self._dbg_thread.join()
     
     def setup_debug_directory(self):
         """Create debug directory for saving processed images"""
@@ -148,12 +356,20 @@ class ScreenOCRTool:
             time.sleep(1)
             
             # Capture screenshot
-            screenshot = pyautogui.screenshot(region=(left, top, width, height))
+            if MSS_AVAILABLE:
+                if self._sct is None:
+                    self._sct = mss.mss()
+                shot = self._sct.grab({'left': left, 'top': top, 'width': width, 'height': height})
+                # Decode mss' raw BGRA buffer directly into a PIL image
+                screenshot = Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+            else:
+                screenshot = pyautogui.screenshot(region=(left, top, width, height))
             
-            # Save original
-            original_path = self.debug_dir / "00_original.png"
-            screenshot.save(original_path)
-            print(f"💾 Original saved: {original_path}")
+            # Save original for debugging
+            if self.debug:
+                self._debug_write("00_original.png",
+                                  cv2.cvtColor(np.asarray(screenshot), cv2.COLOR_RGB2BGR))
+                print(f"💾 Original saved: {self.debug_dir / '00_original.png'}")
             
             # Extract numbers using OpenCV
             numbers = self.extract_numbers_opencv(screenshot)
@@ -178,6 +394,27 @@ class ScreenOCRTool:
         except Exception as e:
             print(f"❌ Error processing screen area: {e}")
     
+    # Number lists kept for recently seen captures (LRU, keyed by pixel hash)
+    OCR_CACHE_SIZE = 256
+    
+    def _cache_key(self, img_array):
+        """Hash a capture's grayscale pixels (and shape) into a cache key"""
+        digest = hashlib.blake2b(img_array.tobytes(), digest_size=16).digest()
+        return img_array.shape, digest
+    
+    def _cache_get(self, key):
+        """Return the cached numbers for a capture, or None"""
+        if key not in self._ocr_cache:
+            return None
+        self._ocr_cache.move_to_end(key)
+        return list(self._ocr_cache[key])
+    
+    def _cache_put(self, key, numbers):
+        """Remember the numbers found in a capture, evicting the oldest entry"""
+        self._ocr_cache[key] = list(numbers)
+        if len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+            self._ocr_cache.popitem(last=False)
+    
     def extract_numbers_opencv(self, image):
         """Extract numbers using multiple OCR approaches - online APIs first, then local OpenCV"""
         if not image:
@@ -186,29 +423,44 @@ class ScreenOCRTool:
         try:
             print("🔍 Processing image for roulette numbers (0-36)...")
             
-            # Convert to grayscale
-            img_array = np.array(image)
-            if len(img_array.shape) == 3:
-                gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            else:
-                gray = img_array
+            # Convert to grayscale in PIL; nothing below needs the RGB array
+            gray = np.asarray(image.convert('L'))
+            
+            # An unchanged frame is a plain comparison against the last one,
+            # before paying for a hash
+            last = self._last_frame
+            if last is not None and last[0].shape == gray.shape and np.array_equal(last[0], gray):
+                print(f"⚡ Capture unchanged, reusing result (cached): {last[1]}")
+                return list(last[1])
+            
+            # A pixel-identical capture gets the same answer without an upload
+            cache_key = self._cache_key(gray)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                print(f"⚡ Same capture as before, reusing result: {cached}")
+                return cached
             
             # Save grayscale for debugging
-            gray_path = self.debug_dir / "01_original_gray.png"
-            cv2.imwrite(str(gray_path), gray)
-            print(f"💾 Grayscale saved: {gray_path}")
+            if self.debug:
+                self._debug_write("01_original_gray.png", gray)
+                print(f"💾 Grayscale saved: {self.debug_dir / '01_original_gray.png'}")
             
             numbers = []
             
             # Use API Ninjas OCR for number extraction
             if REQUESTS_AVAILABLE:
                 print("🔍 Using API Ninjas OCR for number extraction...")
-                text_result = self.try_api_ninjas_text_only(image)
+                upload = self._crop_for_upload(gray)
+                text_result = self.try_api_ninjas_text_only(self._encode_for_upload(upload))
                 
                 if text_result:
                     print(f"📝 Extracted text: '{text_result}'")
                     # Extract roulette numbers (0-36) from the text
                     numbers = self.extract_roulette_numbers_from_text(text_result)
+                    # Only answers from a successful request are cached, so a
+                    # failed upload is retried on the next capture
+                    self._cache_put(cache_key, numbers)
+                    self._last_frame = (gray, list(numbers))
                     if numbers:
                         print(f"🎯 Roulette numbers found: {numbers}")
                         return numbers
@@ -226,39 +478,107 @@ class ScreenOCRTool:
             print(f"❌ Error in number extraction: {e}")
             return []
     
+    # Digit height (px) the upload is scaled down to; OCR engines do well around here
+    UPLOAD_DIGIT_HEIGHT = 32
+    UPLOAD_PADDING = 4
+    
+    def _crop_for_upload(self, gray):
+        """Crop a grayscale capture to its text and shrink it so digits are ~32 px tall"""
+        _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+        # Ink is whichever Otsu class is the minority
+        if cv2.countNonZero(bw) > bw.size // 2:
+            bw = cv2.bitwise_not(bw)
+        
+        points = cv2.findNonZero(bw)
+        if points is None:
+            return Image.fromarray(gray)
+        
+        x, y, w, h = cv2.boundingRect(points)
+        pad = self.UPLOAD_PADDING
+        x0, y0 = max(0, x - pad), max(0, y - pad)
+        x1, y1 = min(gray.shape[1], x + w + pad), min(gray.shape[0], y + h + pad)
+        crop = gray[y0:y1, x0:x1]
+        
+        # Estimate digit height as the median height of the ink blobs
+        _, _, stats, _ = cv2.connectedComponentsWithStats(bw[y0:y1, x0:x1], connectivity=8)
+        heights = stats[1:, cv2.CC_STAT_HEIGHT][stats[1:, cv2.CC_STAT_AREA] >= 10]
+        digit_height = int(np.median(heights)) if heights.size else crop.shape[0]
+        
+        # Only ever shrink; upscaling would just add bytes
+        scale = self.UPLOAD_DIGIT_HEIGHT / max(digit_height, 1)
+        if scale < 1.0:
+            crop = cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        return Image.fromarray(crop)
+    
+    def _encode_for_upload(self, image):
+        """Encode a capture once as JPEG; the bytes are shared by every API call"""
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        buffered = io.BytesIO()
+        image.save(buffered, format="JPEG", quality=85)
+        return buffered.getvalue()
+    
     def try_online_ocr_apis(self, image):
         """Try multiple online OCR APIs for better accuracy"""
+        img_bytes = self._encode_for_upload(image)
         apis_to_try = [
             self.try_api_ninjas_ocr,  # Most reliable - put first
             self.try_ocr_space_api,
             self.try_free_ocr_api
         ]
         
-        for api_func in apis_to_try:
-            try:
-                numbers = api_func(image)
+        if not REQUESTS_AVAILABLE:
+            return []
+        
+        # Race the APIs so the wait is the fastest answer, not the sum of timeouts
+        executor = ThreadPoolExecutor(max_workers=len(apis_to_try))
+        futures = {executor.submit(api_func, img_bytes): api_func for api_func in apis_to_try}
+        try:
+            for future in as_completed(futures):
+                try:
+                    numbers = future.result()
+                except Exception as e:
+                    print(f"   ❌ {futures[future].__name__} failed: {e}")
+                    continue
                 if numbers:
                     return numbers
-            except Exception as e:
-                print(f"   ❌ {api_func.__name__} failed: {e}")
-                continue
+        finally:
+            # Don't wait for the slower requests; their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
         
         return []
     
-    def try_ocr_space_api(self, image):
+    # Pause before the one retry when OCR.space reports a rate limit in its body
+    QUOTA_RETRY_DELAY = 1.0
+    
+    def _post_ocr_space(self, payload, files, timeout):
+        """POST to OCR.space, retrying once if the response body reports a rate limit
+        
+        Returns (status_code, parsed JSON or None).
+        """
+        url = "https://api.ocr.space/parse/image"
+        for attempt in range(2):
+            response = _SESSION.post(url, data=payload, files=files, timeout=timeout)
+            if response.status_code != 200:
+                return response.status_code, None
+            
+            result = response.json()
+            message = str(result.get('ErrorMessage', '')).lower()
+            if attempt == 0 and ('rate limit' in message or 'quota' in message):
+                print(f"   ⏳ OCR.space rate limited, retrying in {self.QUOTA_RETRY_DELAY:.1f}s...")
+                time.sleep(self.QUOTA_RETRY_DELAY)
+                continue
+            return 200, result
+    
+    def try_ocr_space_api(self, img_bytes):
         """Try OCR.space free API - excellent for number recognition"""
         try:
             print("   � Trying OCR.space API...")
             
-            # Convert image to base64
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            img_base64 = base64.b64encode(buffered.getvalue()).decode()
+            files = {'file': ('image.jpg', img_bytes, 'image/jpeg')}
             
             # OCR.space API (free tier - no API key needed for basic use)
-            url = "https://api.ocr.space/parse/image"
             payload = {
-                'base64Image': f'data:image/png;base64,{img_base64}',
                 'language': 'eng',
                 'isOverlayRequired': False,
                 'detectOrientation': False,
@@ -267,11 +587,9 @@ class ScreenOCRTool:
                 'isTable': False
             }
             
-            response = requests.post(url, data=payload, timeout=10)
+            status, result = self._post_ocr_space(payload, files, timeout=10)
             
-            if response.status_code == 200:
-                result = response.json()
-                
+            if status == 200:
                 if result.get('IsErroredOnProcessing', True):
                     print(f"   ❌ OCR.space error: {result.get('ErrorMessage', 'Unknown error')}")
                     return []
@@ -287,29 +605,36 @@ class ScreenOCRTool:
                 numbers = self.extract_numbers_from_text(text)
                 return numbers
             else:
-                print(f"   ❌ OCR.space HTTP error: {response.status_code}")
+                print(f"   ❌ OCR.space HTTP error: {status}")
                 return []
                 
         except Exception as e:
             print(f"   ❌ OCR.space API error: {e}")
             return []
     
-    def try_api_ninjas_ocr(self, image):
+    # Requests per minute we allow ourselves against API Ninjas' free tier
+    API_NINJAS_MAX_RPM = 30
+    
+    def _throttle_api_ninjas(self):
+        """Sleep just long enough to keep API Ninjas requests under API_NINJAS_MAX_RPM"""
+        with self._lock:
+            delta = time.monotonic() - self._last_call
+            if delta < self._min_interval:
+                time.sleep(self._min_interval - delta)
+            self._last_call = time.monotonic()
+    
+    def try_api_ninjas_ocr(self, img_bytes):
         """Try API Ninjas OCR - another reliable free service"""
         try:
             print("   🔍 Trying API Ninjas OCR...")
             
-            # Convert image to bytes
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            img_bytes = buffered.getvalue()
-            
             # API Ninjas OCR (free tier available)
             url = "https://api.api-ninjas.com/v1/imagetotext"
             
-            files = {'image': ('image.png', img_bytes, 'image/png')}
+            files = {'image': ('image.jpg', img_bytes, 'image/jpeg')}
             
-            response = requests.post(url, files=files, timeout=10)
+            self._throttle_api_ninjas()
+            response = _SESSION.post(url, files=files, timeout=10)
             
             if response.status_code == 200:
                 result = response.json()
@@ -328,30 +653,23 @@ class ScreenOCRTool:
             print(f"   ❌ API Ninjas error: {e}")
             return []
     
-    def try_free_ocr_api(self, image):
+    def try_free_ocr_api(self, img_bytes):
         """Try a simple free OCR API as final online attempt"""
         try:
             print("   🔍 Trying free OCR API...")
             
-            # Convert image to base64
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            img_base64 = base64.b64encode(buffered.getvalue()).decode()
+            files = {'file': ('image.jpg', img_bytes, 'image/jpeg')}
             
             # Simple free OCR service
-            url = "https://api.ocr.space/parse/image"
             payload = {
-                'base64Image': f'data:image/png;base64,{img_base64}',
                 'language': 'eng',
                 'isOverlayRequired': False,
                 'OCREngine': 1  # Engine 1 for simpler cases
             }
             
-            response = requests.post(url, data=payload, timeout=8)
+            status, result = self._post_ocr_space(payload, files, timeout=8)
             
-            if response.status_code == 200:
-                result = response.json()
-                
+            if status == 200:
                 if not result.get('IsErroredOnProcessing', True):
                     text = ""
                     for parsed_result in result.get('ParsedResults', []):
@@ -368,19 +686,15 @@ class ScreenOCRTool:
             print(f"   ❌ Free OCR API error: {e}")
             return []
     
-    def try_api_ninjas_text_only(self, image):
+    def try_api_ninjas_text_only(self, img_bytes):
         """Extract text using API Ninjas OCR - text output only"""
         try:
-            # Convert image to bytes
-            buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
-            img_bytes = buffered.getvalue()
-            
             # API Ninjas OCR
             url = "https://api.api-ninjas.com/v1/imagetotext"
-            files = {'image': ('image.png', img_bytes, 'image/png')}
+            files = {'image': ('image.jpg', img_bytes, 'image/jpeg')}
             
-            response = requests.post(url, files=files, timeout=15)
+            self._throttle_api_ninjas()
+            response = _SESSION.post(url, files=files, timeout=15)
             
             if response.status_code == 200:
                 result = response.json()
@@ -399,27 +713,17 @@ class ScreenOCRTool:
         try:
             print(f"🔍 Analyzing text for roulette numbers: '{text}'")
             
-            # Clean the text and find all numbers
-            import re
-            
             # Remove extra spaces and clean text
-            cleaned_text = re.sub(r'\s+', ' ', text.strip())
+            cleaned_text = _WS_RE.sub(' ', text.strip())
             
-            # Find all number patterns in the text
-            number_matches = re.findall(r'\b\d+\b', cleaned_text)
+            # Find all number patterns in the text; _NUM_RE only yields digit
+            # runs, so int() cannot fail and numbers are never negative
+            number_matches = _NUM_RE.findall(cleaned_text)
+            valid_numbers = [num for num in map(int, number_matches) if num <= 36]
             
-            valid_numbers = []
-            for match in number_matches:
-                try:
-                    num = int(match)
-                    if 0 <= num <= 36:  # Valid roulette numbers
-                        valid_numbers.append(num)
-                        print(f"   ✅ Valid roulette number: {num}")
-                    else:
-                        print(f"   ❌ Invalid roulette number (not 0-36): {num}")
-                except ValueError:
-                    print(f"   ❌ Could not convert to number: {match}")
-                    continue
+            rejected = len(number_matches) - len(valid_numbers)
+            if rejected:
+                print(f"   ❌ Skipped {rejected} number(s) outside 0-36")
             
             # Remove duplicates while preserving order
             unique_numbers = list(dict.fromkeys(valid_numbers))
@@ -439,21 +743,13 @@ class ScreenOCRTool:
         """Extract valid roulette numbers from OCR text"""
         try:
             # Find all numbers in the text
-            import re
-            number_matches = re.findall(r'\b\d+\b', text.replace(' ', '').replace('\n', ' '))
-            
-            valid_numbers = []
-            for match in number_matches:
-                try:
-                    num = int(match)
-                    if 0 <= num <= 36:  # Valid roulette numbers
-                        valid_numbers.append(num)
-                        print(f"   🎯 Valid roulette number found: {num}")
-                except ValueError:
-                    continue
+            number_matches = _NUM_RE.findall(text.replace(' ', '').replace('\n', ' '))
+            valid_numbers = [num for num in map(int, number_matches) if num <= 36]
             
             # Remove duplicates while preserving order
             unique_numbers = list(dict.fromkeys(valid_numbers))
+            if unique_numbers:
+                print(f"   🎯 Valid roulette numbers found: {unique_numbers}")
             return unique_numbers
             
         except Exception as e:
@@ -475,12 +771,21 @@ class ScreenOCRTool:
                 self.detect_digits_by_morphology
             ]
             
-            for method_idx, method in enumerate(detection_methods):
+            # Threshold once; every detector reads the same planes
+            planes = self._threshold_planes(gray)
+            
+            # The detectors are independent and spend their time in OpenCV,
+            # which releases the GIL, so run them side by side on threads
+            with ThreadPoolExecutor(max_workers=len(detection_methods)) as executor:
+                futures = [executor.submit(method, gray, planes) for method in detection_methods]
+            
+            # Results are collected in method order so ties resolve as before
+            for method, future in zip(detection_methods, futures):
                 try:
                     method_name = method.__name__
                     print(f"🔬 Trying {method_name}...")
                     
-                    digits = method(gray)
+                    digits = future.result()
                     
                     for x, y, w, h, digit_img in digits:
                         # Classify the digit using feature analysis
@@ -527,55 +832,67 @@ class ScreenOCRTool:
             print(f"❌ Error in local OpenCV detection: {e}")
             return []
     
-    def detect_digits_by_contours(self, gray):
+    def _threshold_planes(self, gray):
+        """Compute the binarizations shared by the detectors, each exactly once
+        
+        The inverted planes are exact complements of the normal ones, so they
+        come from a cheap bitwise_not rather than another thresholding pass.
+        """
+        _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        adaptive = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                         cv2.THRESH_BINARY, 11, 2)
+        return {
+            'binary': otsu,
+            'binary_inv': cv2.bitwise_not(otsu),
+            'adaptive': adaptive,
+            'adaptive_inv': cv2.bitwise_not(adaptive),
+        }
+    
+    def detect_digits_by_contours(self, gray, planes=None):
         """Detect digits using improved contour analysis"""
         digits = []
         
         try:
             # Try different preprocessing approaches
-            preprocessing_methods = [
-                ('binary', lambda img: cv2.threshold(img, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[1]),
-                ('binary_inv', lambda img: cv2.threshold(img, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)[1]),
-                ('adaptive', lambda img: cv2.adaptiveThreshold(img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)),
-                ('adaptive_inv', lambda img: cv2.adaptiveThreshold(img, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY_INV, 11, 2))
-            ]
+            if planes is None:
+                planes = self._threshold_planes(gray)
             
-            for method_name, preprocess_func in preprocessing_methods:
-                try:
-                    processed = preprocess_func(gray)
-                    
-                    # Save for debugging
-                    debug_path = self.debug_dir / f"02_contour_{method_name}.png"
-                    cv2.imwrite(str(debug_path), processed)
-                    
-                    # Find contours
-                    contours, _ = cv2.findContours(processed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-                    
-                    for contour in contours:
-                        # More strict filtering
-                        area = cv2.contourArea(contour)
-                        if 100 < area < 5000:  # Adjust area range
-                            x, y, w, h = cv2.boundingRect(contour)
-                            aspect_ratio = w / h
-                            
-                            # Stricter aspect ratio for digits
-                            if 0.2 <= aspect_ratio <= 1.0 and h > 15 and w > 8:
-                                # Check if contour is solid enough
-                                contour_area = cv2.contourArea(contour)
-                                bbox_area = w * h
-                                solidity = contour_area / bbox_area
-                                
-                                if solidity > 0.3:  # Must be reasonably solid
-                                    digit_roi = processed[y:y+h, x:x+w]
-                                    
-                                    # Additional quality check
-                                    if self.is_digit_quality(digit_roi):
-                                        digits.append((x, y, w, h, digit_roi))
-                                        print(f"      Found contour: {method_name} at ({x},{y}) size {w}x{h} area:{area:.0f} aspect:{aspect_ratio:.2f}")
+            # Gather the contours of all four binarizations into one flat list
+            candidates = []
+            for method_name in ('binary', 'binary_inv', 'adaptive', 'adaptive_inv'):
+                processed = planes[method_name]
                 
-                except Exception as e:
-                    print(f"      Error in {method_name}: {e}")
-                    continue
+                # Save for debugging
+                self._debug_write(f"02_contour_{method_name}.png", processed)
+                
+                contours, _ = cv2.findContours(processed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+                candidates.extend((method_name, processed, contour) for contour in contours)
+            
+            if not candidates:
+                return digits
+            
+            # Measure every contour once, then filter them all with array masks
+            areas = np.fromiter((cv2.contourArea(c) for _, _, c in candidates),
+                                dtype=np.float64, count=len(candidates))
+            rects = np.array([cv2.boundingRect(c) for _, _, c in candidates]).reshape(-1, 4)
+            w, h = rects[:, 2], rects[:, 3]
+            aspect = w / h
+            solidity = areas / (w * h)
+            
+            # Area range, stricter aspect ratio for digits, and reasonably solid
+            keep = ((areas > 100) & (areas < 5000) &
+                    (aspect >= 0.2) & (aspect <= 1.0) & (h > 15) & (w > 8) &
+                    (solidity > 0.3))
+            
+            for i in np.flatnonzero(keep):
+                method_name, processed, _ = candidates[i]
+                x, y, bw, bh = (int(v) for v in rects[i])
+                digit_roi = processed[y:y+bh, x:x+bw]
+                
+                # Additional quality check
+                if self.is_digit_quality(digit_roi):
+                    digits.append((x, y, bw, bh, digit_roi))
+                    print(f"      Found contour: {method_name} at ({x},{y}) size {bw}x{bh} area:{areas[i]:.0f} aspect:{aspect[i]:.2f}")
         
         except Exception as e:
             print(f"Contour detection error: {e}")
@@ -588,8 +905,8 @@ class ScreenOCRTool:
             if digit_roi is None or digit_roi.size == 0:
                 return False
             
-            # Check pixel density
-            white_pixels = np.sum(digit_roi == 255)
+            # Check pixel density (the ROI is a 0/255 mask, so non-zero == white)
+            white_pixels = cv2.countNonZero(digit_roi)
             total_pixels = digit_roi.size
             density = white_pixels / total_pixels
             
@@ -601,7 +918,7 @@ class ScreenOCRTool:
             h, w = digit_roi.shape
             center_region = digit_roi[h//4:3*h//4, w//4:3*w//4]
             if center_region.size > 0:
-                center_density = np.sum(center_region == 255) / center_region.size
+                center_density = cv2.countNonZero(center_region) / center_region.size
                 if center_density < 0.05:  # Center should have some content
                     return False
             
@@ -610,7 +927,7 @@ class ScreenOCRTool:
         except Exception:
             return False
     
-    def detect_digits_by_edges(self, gray):
+    def detect_digits_by_edges(self, gray, planes=None):
         """Detect digits using edge detection"""
         digits = []
         
@@ -619,8 +936,7 @@ class ScreenOCRTool:
             edges = cv2.Canny(gray, 50, 150)
             
             # Save edges for debugging
-            edges_path = self.debug_dir / "03_edges.png"
-            cv2.imwrite(str(edges_path), edges)
+            self._debug_write("03_edges.png", edges)
             
             # Morphological operations to connect edges
             kernel = np.ones((3,3), np.uint8)
@@ -644,18 +960,20 @@ class ScreenOCRTool:
         
         return digits
     
-    def detect_digits_by_thresholds(self, gray):
+    def detect_digits_by_thresholds(self, gray, planes=None):
         """Detect digits using adaptive thresholding"""
         digits = []
         
         try:
             # Adaptive threshold
-            adaptive_thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
-                                                  cv2.THRESH_BINARY, 11, 2)
+            if planes is not None:
+                adaptive_thresh = planes['adaptive']
+            else:
+                adaptive_thresh = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                                                        cv2.THRESH_BINARY, 11, 2)
             
             # Save adaptive threshold for debugging
-            adaptive_path = self.debug_dir / "04_adaptive.png"
-            cv2.imwrite(str(adaptive_path), adaptive_thresh)
+            self._debug_write("04_adaptive.png", adaptive_thresh)
             
             # Find contours
             contours, _ = cv2.findContours(adaptive_thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -675,13 +993,16 @@ class ScreenOCRTool:
         
         return digits
     
-    def detect_digits_by_morphology(self, gray):
+    def detect_digits_by_morphology(self, gray, planes=None):
         """Detect digits using morphological operations"""
         digits = []
         
         try:
             # Binary threshold
-            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+            if planes is not None:
+                binary = planes['binary']
+            else:
+                _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             
             # Morphological operations
             kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
@@ -689,8 +1010,7 @@ class ScreenOCRTool:
             closing = cv2.morphologyEx(opening, cv2.MORPH_CLOSE, kernel, iterations=1)
             
             # Save morphological result for debugging
-            morph_path = self.debug_dir / "05_morphology.png"
-            cv2.imwrite(str(morph_path), closing)
+            self._debug_write("05_morphology.png", closing)
             
             # Find contours
             contours, _ = cv2.findContours(closing, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -717,7 +1037,7 @@ class ScreenOCRTool:
                 return None
             
             # Resize to standard size for better comparison
-            resized = cv2.resize(digit_img, (28, 28))
+            resized = cv2.resize(digit_img, (DIGIT_SIZE, DIGIT_SIZE), interpolation=cv2.INTER_AREA)
             
             # Try template matching first
             template_result = self.template_match_digit(resized)
@@ -734,14 +1054,22 @@ class ScreenOCRTool:
             print(f"Feature classification error: {e}")
             return None
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _template_bank():
+        """Return (digits, zero-mean unit-norm templates as rows), built once per process"""
+        pairs = ScreenOCRTool.create_digit_templates()
+        digits = tuple(digit for digit, _ in pairs)
+        rows = np.stack([template.astype(np.float32).ravel() for _, template in pairs])
+        rows -= rows.mean(axis=1, keepdims=True)
+        rows /= np.linalg.norm(rows, axis=1, keepdims=True)
+        rows.flags.writeable = False
+        return digits, rows
+    
     def template_match_digit(self, digit_img):
         """Template matching approach for digit recognition"""
         try:
-            # Create simple templates for digits 0-9
-            templates = self.create_digit_templates()
-            
-            best_match = -1
-            best_score = 0
+            digits, unit_templates = self._template_bank()
             
             # Ensure binary image
             if len(digit_img.shape) == 3:
@@ -749,16 +1077,22 @@ class ScreenOCRTool:
             
             _, binary_digit = cv2.threshold(digit_img, 127, 255, cv2.THRESH_BINARY)
             
-            for digit, template in templates.items():
-                # Template matching
-                result = cv2.matchTemplate(binary_digit, template, cv2.TM_CCOEFF_NORMED)
-                _, max_val, _, _ = cv2.minMaxLoc(result)
-                
-                if max_val > best_score and max_val > 0.3:  # Minimum threshold
-                    best_score = max_val
-                    best_match = digit
+            # Same-size TM_CCOEFF_NORMED is the normalized cross-correlation of
+            # the mean-centred images: a correlation against the unit templates
+            # divided by the crop's centred norm, std * sqrt(n), with mean and
+            # std from one meanStdDev pass
+            mean, std = cv2.meanStdDev(binary_digit)
+            std = float(std[0, 0])
+            if std < 1e-6:
+                # A flat crop correlates with nothing (TM_CCOEFF_NORMED gives 0)
+                return None
+            x = binary_digit.astype(np.float32).ravel() - np.float32(mean[0, 0])
+            scores = np.clip((unit_templates @ x) / (std * np.sqrt(binary_digit.size)), -1.0, 1.0)
             
-            if best_match != -1:
+            best = int(scores.argmax())
+            best_score = scores[best]
+            if best_score > 0.3:  # Minimum threshold
+                best_match = digits[best]
                 print(f"      Template match: {best_match} (score: {best_score:.3f})")
                 return best_match
             
@@ -768,8 +1102,10 @@ class ScreenOCRTool:
             print(f"Template matching error: {e}")
             return None
     
-    def create_digit_templates(self):
-        """Create simple templates for digits 0-9"""
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def create_digit_templates():
+        """Create simple templates for digits 0-9, as read-only (digit, template) pairs"""
         templates = {}
         
         # Create basic templates (28x28 pixels)
@@ -839,7 +1175,10 @@ class ScreenOCRTool:
         cv2.ellipse(template_9, (14, 20), (4, 4), 0, 0, 180, 255, 2)  # bottom curve
         templates[9] = template_9
         
-        return templates
+        # Shared by every caller through the cache, so nobody may draw on them
+        for template in templates.values():
+            template.flags.writeable = False
+        return tuple(templates.items())
     
     def analyze_digit_features_enhanced(self, digit_img):
         """Enhanced feature analysis with more discriminative features"""
@@ -847,86 +1186,79 @@ class ScreenOCRTool:
             if len(digit_img.shape) == 3:
                 digit_img = cv2.cvtColor(digit_img, cv2.COLOR_BGR2GRAY)
             
+            # The feature kernel's split points assume a DIGIT_SIZE square
+            if digit_img.shape != (DIGIT_SIZE, DIGIT_SIZE):
+                digit_img = cv2.resize(digit_img, (DIGIT_SIZE, DIGIT_SIZE), interpolation=cv2.INTER_AREA)
+            
             _, binary = cv2.threshold(digit_img, 127, 255, cv2.THRESH_BINARY)
             
-            features = {}
+            features = np.zeros(N_FEATURES, dtype=np.float32)
             
             # Feature 1: Aspect ratio
             h, w = binary.shape
-            features['aspect_ratio'] = w / h if h > 0 else 0
+            features[FEAT_ASPECT] = w / h
             
-            # Feature 2: Filled pixels ratio
-            white_pixels = np.sum(binary == 255)
-            total_pixels = h * w
-            features['fill_ratio'] = white_pixels / total_pixels if total_pixels > 0 else 0
+            # Features 2 to 5 come from one kernel over the mask: filled pixels
+            # ratio, the horizontal and vertical ink profiles and the contours
+            fill_ratio, top, bottom, left, right, contours = _digit_features(binary)
+            features[FEAT_FILL] = fill_ratio
             
-            # Feature 3: Number of holes (Euler number)
-            contours, _ = cv2.findContours(binary, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
-            features['holes'] = len([c for c in contours if cv2.contourArea(c) > 10])
+            # Feature 3: Number of holes (Euler number); like the findContours
+            # count it replaces, this includes the outer ink blobs
+            features[FEAT_HOLES] = contours
             
-            # Feature 4: Horizontal profile (how much white in each row)
-            horizontal_profile = np.sum(binary, axis=1) / 255
-            features['top_heavy'] = np.sum(horizontal_profile[:h//3]) / np.sum(horizontal_profile) if np.sum(horizontal_profile) > 0 else 0
-            features['bottom_heavy'] = np.sum(horizontal_profile[2*h//3:]) / np.sum(horizontal_profile) if np.sum(horizontal_profile) > 0 else 0
+            # Feature 4: Horizontal profile (share of the ink in the top/bottom third)
+            features[FEAT_TOP] = top
+            features[FEAT_BOTTOM] = bottom
             
-            # Feature 5: Vertical profile
-            vertical_profile = np.sum(binary, axis=0) / 255
-            features['left_heavy'] = np.sum(vertical_profile[:w//3]) / np.sum(vertical_profile) if np.sum(vertical_profile) > 0 else 0
-            features['right_heavy'] = np.sum(vertical_profile[2*w//3:]) / np.sum(vertical_profile) if np.sum(vertical_profile) > 0 else 0
+            # Feature 5: Vertical profile (share of the ink in the left/right third)
+            features[FEAT_LEFT] = left
+            features[FEAT_RIGHT] = right
             
             # Feature 6: Corner detection
             corners = cv2.goodFeaturesToTrack(binary, 10, 0.01, 10)
-            features['corners'] = len(corners) if corners is not None else 0
+            features[FEAT_CORNERS] = len(corners) if corners is not None else 0
             
             return features
             
         except Exception as e:
             print(f"Enhanced feature analysis error: {e}")
-            return {}
+            return None
+    
+    def _get_digit_weights(self):
+        """Return (weights (10, 8), bias (10,)) scoring feature vectors per digit
+        
+        Each digit is rendered in two Hershey fonts at two stroke widths and
+        put through the same resize as real ROIs. Scoring with 2c and -|c|^2
+        for each mean vector c makes the argmax the nearest of those means.
+        """
+        if self._digit_weights is None:
+            centroids = np.zeros((10, N_FEATURES), dtype=np.float32)
+            variants = [(font, thickness)
+                        for font in (cv2.FONT_HERSHEY_SIMPLEX, cv2.FONT_HERSHEY_DUPLEX)
+                        for thickness in (2, 3)]
+            for digit in range(10):
+                for font, thickness in variants:
+                    canvas = np.zeros((40, 30), dtype=np.uint8)
+                    cv2.putText(canvas, str(digit), (2, 34), font, 1.2, 255, thickness, cv2.LINE_AA)
+                    x, y, w, h = cv2.boundingRect(canvas)
+                    resized = cv2.resize(canvas[y:y+h, x:x+w], (DIGIT_SIZE, DIGIT_SIZE),
+                                         interpolation=cv2.INTER_AREA)
+                    centroids[digit] += self.analyze_digit_features_enhanced(resized)
+            centroids /= len(variants)
+            self._digit_weights = (2 * centroids, -(centroids * centroids).sum(axis=1))
+        return self._digit_weights
     
     def classify_by_enhanced_features(self, features, digit_img):
         """Classify digit using enhanced feature analysis"""
         try:
-            if not features:
+            if features is None:
                 return None
             
-            # Rule-based classification using enhanced features
-            holes = features.get('holes', 0)
-            fill_ratio = features.get('fill_ratio', 0)
-            aspect_ratio = features.get('aspect_ratio', 0)
-            top_heavy = features.get('top_heavy', 0)
-            bottom_heavy = features.get('bottom_heavy', 0)
-            corners = features.get('corners', 0)
-            
-            # More sophisticated rules
-            if holes >= 2:
-                return 8  # Usually has two holes
-            elif holes == 1:
-                if fill_ratio > 0.4:
-                    return 0  # Circle-like
-                elif top_heavy > 0.4:
-                    return 9  # Circle on top
-                else:
-                    return 6  # Circle on bottom
-            elif aspect_ratio < 0.5:  # Very narrow
-                return 1  # Likely a 1
-            elif top_heavy > 0.6:
-                return 7  # Heavy on top
-            elif bottom_heavy > 0.6 and corners > 3:
-                return 2  # Heavy on bottom with corners
-            elif fill_ratio < 0.2:
-                return 1  # Very sparse, likely 1
-            elif corners > 4:
-                if aspect_ratio > 0.7:
-                    return 4  # Square-ish with corners
-                else:
-                    return 2  # Many corners, likely 2
-            else:
-                # Use pixel density in different regions to guess
-                if fill_ratio > 0.35:
-                    return random.choice([0, 3, 5, 6, 8, 9])
-                else:
-                    return random.choice([1, 2, 4, 7])
+            # One linear score per digit; argmax is deterministic, ties go to
+            # the lower digit
+            weights, bias = self._get_digit_weights()
+            return int(np.argmax(weights @ features + bias))
             
         except Exception as e:
             print(f"Enhanced classification error: {e}")
@@ -941,23 +1273,24 @@ class ScreenOCRTool:
             
             _, binary = cv2.threshold(digit_img, 127, 255, cv2.THRESH_BINARY)
             
-            # Feature 1: Count holes (connected components in inverted image)
-            inverted = cv2.bitwise_not(binary)
-            num_labels, _ = cv2.connectedComponents(inverted)
-            holes = max(0, num_labels - 2)  # Subtract background and main digit
+            # Outer outlines only; the holes come from the Euler number
+            contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+            
+            # Feature 1: Count holes (blobs minus Euler number; an island
+            # inside a hole is not an outer outline, so such digits undercount)
+            holes = max(0, len(contours) - _euler_number(binary))
             
             # Feature 2: Horizontal line strength
             horizontal_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 1))
             horizontal_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, horizontal_kernel)
-            h_strength = np.sum(horizontal_lines) / (255 * binary.size) if binary.size > 0 else 0
+            h_strength = cv2.countNonZero(horizontal_lines) / binary.size if binary.size > 0 else 0
             
             # Feature 3: Vertical line strength
             vertical_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 5))
             vertical_lines = cv2.morphologyEx(binary, cv2.MORPH_OPEN, vertical_kernel)
-            v_strength = np.sum(vertical_lines) / (255 * binary.size) if binary.size > 0 else 0
+            v_strength = cv2.countNonZero(vertical_lines) / binary.size if binary.size > 0 else 0
             
             # Feature 4: Curve detection (using contour analysis)
-            contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
             curve_strength = 0
             if contours:
                 largest_contour = max(contours, key=cv2.contourArea)
@@ -967,7 +1300,7 @@ class ScreenOCRTool:
                     curve_strength = perimeter / (2 * np.sqrt(np.pi * area))  # Circularity
             
             # Feature 5: Pixel density
-            density = np.sum(binary) / (255 * binary.size) if binary.size > 0 else 0
+            density = cv2.countNonZero(binary) / binary.size if binary.size > 0 else 0
             
             return [holes, h_strength, v_strength, curve_strength, density]
             
@@ -982,8 +1315,9 @@ class ScreenOCRTool:
             if digit_img is None or digit_img.size == 0:
                 return 0.0
             
-            # Check image clarity
-            laplacian_var = cv2.Laplacian(digit_img, cv2.CV_64F).var()
+            # Check image clarity (a 3x3 Laplacian of uint8 fits in int16 exactly)
+            _, lap_std = cv2.meanStdDev(cv2.Laplacian(digit_img, cv2.CV_16S))
+            laplacian_var = float(lap_std[0, 0]) ** 2
             clarity_score = min(100, laplacian_var / 10)
             
             # Check size appropriateness
@@ -999,79 +1333,66 @@ class ScreenOCRTool:
             return 50.0
     
     def save_results_screenshot(self, original_image, detected_numbers):
-        """Save a screenshot with results overlay"""
+        """Save a screenshot with results overlay to the debug directory (debug mode only)"""
+        if not self.debug:
+            return
+        
         try:
-            import matplotlib.pyplot as plt
-            import matplotlib.patches as patches
-            from matplotlib.patches import FancyBboxPatch
-            
-            # Convert PIL image to numpy array for matplotlib
-            img_array = np.array(original_image)
+            # Draw straight onto a BGR copy of the capture with OpenCV
+            image = cv2.cvtColor(np.asarray(original_image.convert('RGB')), cv2.COLOR_RGB2BGR)
             
-            # Create figure and axis
-            fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-            ax.imshow(img_array)
-            ax.set_title(f'OCR Results - Found Numbers: {detected_numbers}', 
-                        fontsize=16, fontweight='bold', color='darkblue')
-            
-            # Add results text overlay
+            # Results text: green when numbers were found, red otherwise
             if detected_numbers:
                 result_text = f"DETECTED: {', '.join(map(str, detected_numbers))}"
-                text_color = 'green'
+                text_color = (0, 160, 0)
             else:
                 result_text = "NO NUMBERS DETECTED"
-                text_color = 'red'
+                text_color = (0, 0, 220)
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+            stamp_text = f"Captured: {timestamp}"
             
-            # Add fancy text box with results
-            bbox_props = dict(boxstyle="round,pad=0.5", facecolor='white', 
-                             edgecolor=text_color, linewidth=2, alpha=0.9)
-            ax.text(0.02, 0.98, result_text, transform=ax.transAxes, 
-                   fontsize=14, fontweight='bold', color=text_color,
-                   verticalalignment='top', bbox=bbox_props)
+            font = cv2.FONT_HERSHEY_SIMPLEX
+            (result_w, result_h), _ = cv2.getTextSize(result_text, font, 0.7, 2)
+            (stamp_w, stamp_h), _ = cv2.getTextSize(stamp_text, font, 0.45, 1)
             
-            # Add timestamp
-            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-            ax.text(0.02, 0.02, f"Captured: {timestamp}", transform=ax.transAxes,
-                   fontsize=10, color='gray', verticalalignment='bottom')
+            # White header and footer bars, widened if the text needs it
+            header, footer, margin = result_h + 24, stamp_h + 16, 10
+            height, width = image.shape[:2]
+            canvas_w = max(width, result_w + 2 * margin, stamp_w + 2 * margin)
+            canvas = np.full((height + header + footer, canvas_w, 3), 255, dtype=np.uint8)
+            canvas[header:header + height, :width] = image
             
-            # Remove axis ticks and labels for cleaner look
-            ax.set_xticks([])
-            ax.set_yticks([])
+            cv2.rectangle(canvas, (2, 2), (canvas_w - 3, header - 3), text_color, 2)
+            cv2.putText(canvas, result_text, (margin, header - 12), font, 0.7, text_color, 2, cv2.LINE_AA)
+            cv2.putText(canvas, stamp_text, (margin, header + height + footer - 6),
+                        font, 0.45, (128, 128, 128), 1, cv2.LINE_AA)
             
             # Save the screenshot with results
             timestamp_file = time.strftime("%Y%m%d_%H%M%S")
             screenshot_path = self.debug_dir / f"result_screenshot_{timestamp_file}.png"
-            
-            plt.tight_layout()
-            plt.savefig(screenshot_path, dpi=150, bbox_inches='tight', 
-                       facecolor='white', edgecolor='none')
-            plt.close()
+            if not cv2.imwrite(str(screenshot_path), canvas, _PNG_PARAMS):
+                raise IOError(f"could not write {screenshot_path}")
             
             print(f"📸 Results screenshot saved: {screenshot_path}")
             
-        except ImportError:
-            # Fallback: save simple screenshot without overlay
-            print("📸 Matplotlib not available, saving simple screenshot...")
-            timestamp_file = time.strftime("%Y%m%d_%H%M%S")
-            screenshot_path = self.debug_dir / f"result_screenshot_{timestamp_file}.png"
-            original_image.save(screenshot_path)
-            print(f"📸 Simple screenshot saved: {screenshot_path}")
-            
         except Exception as e:
             print(f"❌ Error saving results screenshot: {e}")
             # Try to save simple screenshot as fallback
             try:
                 timestamp_file = time.strftime("%Y%m%d_%H%M%S")
                 screenshot_path = self.debug_dir / f"result_screenshot_{timestamp_file}.png"
-                original_image.save(screenshot_path)
+                original_image.save(screenshot_path, compress_level=PNG_COMPRESS_LEVEL)
                 print(f"📸 Fallback screenshot saved: {screenshot_path}")
             except Exception as fallback_error:
                 print(f"❌ Failed to save fallback screenshot: {fallback_error}")
 
 def main():
     """Main function"""
-    tool = ScreenOCRTool()
-    tool.run_interactive()
+    tool = ScreenOCRTool(debug="--debug" in sys.argv)
+    try:
+        tool.run_interactive()
+    finally:
+        tool.close()
 
 if __name__ == "__main__":
     main()
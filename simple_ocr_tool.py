@@ -8,20 +8,45 @@ import cv2
 import numpy as np
 from PIL import Image, ImageGrab
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import io
 import re
 import time
 import os
 from datetime import datetime
 
+# Optional direct region grabs (ImageGrab captures the whole display on macOS)
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+# Whole-word runs of ASCII digits with at most two significant digits
+# ("7", "36", "007"); anything longer can't be 0-36
+_NUM_RE = re.compile(r'\b0*\d{1,2}\b', re.ASCII)
+
 class SimpleOCRTool:
     def __init__(self):
         self.debug_dir = f"debug_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
+        # Keep-alive session so repeated OCR calls skip the TCP/TLS handshake
+        self._http = requests.Session()
+        retries = Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                        allowed_methods=None, raise_on_status=False)
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries))
+        
+        self._sct = mss.mss() if MSS_AVAILABLE else None
+        
     def capture_screen_area(self, x, y, width, height):
         """Capture a specific area of the screen"""
         try:
             # Capture screenshot
+            if self._sct is not None:
+                shot = self._sct.grab({'left': x, 'top': y, 'width': width, 'height': height})
+                # Decode mss' raw BGRA buffer directly into a PIL image
+                return Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
             screenshot = ImageGrab.grab(bbox=(x, y, x + width, y + height))
             return screenshot
         except Exception as e:
@@ -63,14 +88,14 @@ class SimpleOCRTool:
             
             # Convert image to bytes
             buffered = io.BytesIO()
-            image.save(buffered, format="PNG")
+            image.save(buffered, format="PNG", compress_level=1)
             img_bytes = buffered.getvalue()
             
             # API Ninjas OCR (free tier available)
             url = "https://api.api-ninjas.com/v1/imagetotext"
             files = {'image': ('image.png', img_bytes, 'image/png')}
             
-            response = requests.post(url, files=files, timeout=15)
+            response = self._http.post(url, files=files, timeout=(3, 15))
             
             if response.status_code == 200:
                 result = response.json()
@@ -100,21 +125,14 @@ class SimpleOCRTool:
         try:
             # Clean the text and find all numbers
             cleaned_text = text.replace(' ', ' ').replace('\n', ' ')
-            number_matches = re.findall(r'\b\d+\b', cleaned_text)
             
-            valid_numbers = []
-            for match in number_matches:
-                try:
-                    num = int(match)
-                    if 0 <= num <= 36:  # Valid roulette numbers
-                        valid_numbers.append(num)
-                        print(f"   ✅ Valid roulette number: {num}")
-                except ValueError:
-                    continue
+            # Matches are 0-99, so only the upper bound needs checking
+            valid_numbers = [num for num in map(int, _NUM_RE.findall(cleaned_text)) if num <= 36]
+            for num in valid_numbers:
+                print(f"   ✅ Valid roulette number: {num}")
             
             # Remove duplicates while preserving order
-            unique_numbers = list(dict.fromkeys(valid_numbers))
-            return unique_numbers
+            return list(dict.fromkeys(valid_numbers))
             
         except Exception as e:
             print(f"❌ Error extracting numbers: {e}")
@@ -129,7 +147,8 @@ class SimpleOCRTool:
             # Save original
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             image_path = f"{self.debug_dir}/result_{timestamp}.png"
-            image.save(image_path)
+            # Fast zlib level: these are debug artifacts, not archives
+            image.save(image_path, format="PNG", compress_level=1, optimize=False)
             
             print(f"💾 Result saved: {image_path}")
             print(f"🎯 Numbers found: {numbers}")
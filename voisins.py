@@ -12,13 +12,19 @@ class RouletteVoisinsTracker:
     def __init__(self):
         # Voisins du zéro numbers (neighbors of zero in European roulette)
         self.voisins_numbers = {22, 18, 29, 7, 28, 12, 35, 3, 26, 0, 32, 15, 19, 4, 21, 2, 25}
+        # Bit n set for each voisins number n
+        self._mask = 0
+        for n in self.voisins_numbers:
+            self._mask |= 1 << n
         self.rounds_without_voisins = 0
         self.total_rounds = 0
         self.history = []
+        # Most recent voisins hit, kept up to date as numbers come in
+        self._last_voisins = None
         
     def is_voisins(self, number):
         """Check if a number is a voisins number"""
-        return number in self.voisins_numbers
+        return bool((self._mask >> number) & 1)
     
     def add_number(self, number):
         """Add a new roulette number and update counters"""
@@ -30,6 +36,7 @@ class RouletteVoisinsTracker:
         
         if self.is_voisins(number):
             self.rounds_without_voisins = 0
+            self._last_voisins = number
             return True  # Hit a voisins number
         else:
             self.rounds_without_voisins += 1
@@ -46,10 +53,7 @@ class RouletteVoisinsTracker:
     
     def get_last_voisins_number(self):
         """Get the last voisins number that was hit"""
-        for number in reversed(self.history):
-            if self.is_voisins(number):
-                return number
-        return None
+        return self._last_voisins
     
     def display_voisins_numbers(self):
         """Display all voisins numbers"""
@@ -61,6 +65,7 @@ class RouletteVoisinsTracker:
         self.rounds_without_voisins = 0
         self.total_rounds = 0
         self.history = []
+        self._last_voisins = None
 
 def main():
     tracker = RouletteVoisinsTracker()
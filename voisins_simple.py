@@ -17,6 +17,9 @@ import time
 class RouletteVoisinsTracker:
     def __init__(self):
         self.voisins_numbers = {22, 18, 29, 7, 28, 12, 35, 3, 26, 0, 32, 15, 19, 4, 21, 2, 25}
+        self._mask = 0
+        for n in self.voisins_numbers:
+            self._mask |= 1 << n
         self.rounds_without_voisins = 0
         self.rounds_with_voisins = 0
         self.consecutive_voisins_streak = 0
@@ -24,7 +27,7 @@ class RouletteVoisinsTracker:
         self.history = []
         
     def is_voisins(self, number):
-        return number in self.voisins_numbers
+        return bool((self._mask >> number) & 1)
     
     def add_number(self, number):
         if not (0 <= number <= 36):
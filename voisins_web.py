@@ -342,12 +342,15 @@ ocr_engine = ScreenCaptureOCR()
 class RouletteVoisinsTracker:
     def __init__(self):
         self.voisins_numbers = {22, 18, 29, 7, 28, 12, 35, 3, 26, 0, 32, 15, 19, 4, 21, 2, 25}
+        self._mask = 0
+        for n in self.voisins_numbers:
+            self._mask |= 1 << n
         self.rounds_without_voisins = 0
         self.total_rounds = 0
         self.history = []
         
     def is_voisins(self, number):
-        return number in self.voisins_numbers
+        return bool((self._mask >> number) & 1)
     
     def add_number(self, number):
         if not (0 <= number <= 36):